@@ -2,37 +2,65 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, time as dt_time
+import asyncio
+from collections.abc import Callable
+from datetime import date as date_type, datetime, timedelta
+from functools import lru_cache
 import logging
-
-import pandas as pd
-import pyet
+import math
+import sys
+import time
+from types import ModuleType
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_ON, Platform
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, STATE_ON, Platform
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    State as HAState,
+    callback,
+)
 from homeassistant.helpers.event import (
     EventStateChangedData,
+    async_track_point_in_utc_time,
     async_track_state_change_event,
-    async_track_time_change,
 )
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.components import recorder
 from homeassistant.components.recorder import history
+from homeassistant.components.recorder.statistics import statistics_during_period
 from homeassistant.util import dt as dt_util
 
 from .config import Config, WeatherSensorConfig, ZoneConfig
-from .const import DOMAIN
-from .state import State, WeatherState, ZoneState
-from .calculations import update_zone_calculations
+from .const import DOMAIN, INVALID_STATES, REFRESH_INTERVAL
+from .state import DAILY_STATS_ATTRS, ReadingStats, State, ZoneState
+from .calculations import (
+    calculate_hargreaves_et0,
+    get_forecast_rain,
+    update_zone_calculations,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.NUMBER, Platform.SENSOR]
 
-# Store per-entry instances keyed by entry_id
-CONFIGS: dict[str, Config] = {}
-STATES: dict[str, State] = {}
+# Shared midnight ET timer, started with the first entry
+_UNSUB_MIDNIGHT: CALLBACK_TYPE | None = None
+
+# Recorder rows can also hold a stringified None
+_INVALID_HISTORY_STATES = INVALID_STATES | {"None"}
+
+StateHandler = Callable[[HAState, HAState | None], None]
+
+# Balances are snapshotted to a per-entry store on shutdown and unload, so
+# the last value survives even if the restore state dump missed it
+BALANCE_STORE_VERSION = 1
+
+# pandas/pyet are slow to import and only needed by the daily ET calculation.
+# None = not yet imported, False = import failed
+_ET_MODULES: tuple[ModuleType, ModuleType] | bool | None = None
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -45,175 +73,248 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Setting up Adaptive Irrigation from config entry: %s", entry.entry_id)
 
     try:
-        # Create per-entry instances
-        CONFIGS[entry.entry_id] = Config()
-        STATES[entry.entry_id] = State()
-
-        config = CONFIGS[entry.entry_id]
-        state = STATES[entry.entry_id]
-
-        # Parse configuration from config entry
-        parse_config(entry, config)
+        # Parse configuration from config entry and create per-entry state
+        config = parse_config(entry)
+        state = State()
         initialise_state(hass, config, state)
 
-        # Track entity state changes
-        entity_ids = [
-            config.weather_sensors.precipitation_entity,
-        ]
-
-        if config.weather_sensors.forecast_rain_entity:
-            entity_ids.append(config.weather_sensors.forecast_rain_entity)
+        # Bound once so handlers avoid repeated attribute lookups per event
+        entry_id = entry.entry_id
+        weather = state.weather
+        zone_states = state.zones
+        # Zones are fixed once configured (options changes reload the entry)
+        zone_items: tuple[tuple[str, ZoneState], ...] = tuple(zone_states.items())
 
-        # Add sprinkler entities
-        for zone_config in config.zones.values():
-            entity_ids.append(zone_config.sprinkler_entity)
+        precip_low, precip_high = _VALID_RANGES["precipitation"]
 
-        async def state_change_listener(event: Event[EventStateChangedData]) -> None:
-            """Handle state changes for weather sensors and sprinklers."""
-            if event.event_type != "state_changed":
+        def handle_precipitation(new_state: HAState, old_state: HAState | None) -> None:
+            """Add any increase in cumulative precipitation to all zones."""
+            if new_state.state in INVALID_STATES:
                 return
 
-            entity_id = event.data["entity_id"]
-            new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
+            new_precip = float(new_state.state)
 
-            if new_state is None:
+            # Validate precipitation value
+            if not precip_low <= new_precip <= precip_high:
+                _LOGGER.warning(
+                    "Invalid precipitation value: %.2f mm (ignored)", new_precip
+                )
                 return
 
-            # Weather sensor state changes
-            if entity_id == config.weather_sensors.precipitation_entity:
-                if new_state.state not in ("unknown", "unavailable"):
-                    new_precip = float(new_state.state)
-
-                    # Validate precipitation value
-                    if not is_valid_precipitation(new_precip):
-                        _LOGGER.warning(
-                            "Invalid precipitation value: %.2f mm (ignored)", new_precip
-                        )
-                        return
-
-                    # Skip processing on first update (old_state is None on startup)
-                    # This prevents adding accumulated rainfall on restart
-                    if old_state is None or old_state.state in ("unknown", "unavailable"):
-                        _LOGGER.debug(
-                            "Skipping precipitation update - no previous state (startup or sensor unavailable)"
-                        )
-                        state.weather.precipitation = new_precip
-                        return
-
-                    old_precip = float(old_state.state)
-
-                    # If precipitation increased, add to all zones
-                    precip_diff = new_precip - old_precip
-                    if precip_diff > 0:
-                        # Additional sanity check on the difference
-                        if precip_diff > 200.0:
-                            _LOGGER.warning(
-                                "Excessive rainfall detected: %.2f mm (ignored, likely sensor error)",
-                                precip_diff,
-                            )
-                            return
-
-                        _LOGGER.info("Rainfall detected: %.2f mm", precip_diff)
-                        for zone_id, zone_state in state.zones.items():
-                            # Add rainfall to balance (moves toward excess/positive)
-                            zone_state.soil_moisture_balance += precip_diff
-                            zone_state.last_rainfall = precip_diff
-                            update_zone_number(
-                                hass,
-                                entry.entry_id,
-                                zone_id,
-                                zone_state.soil_moisture_balance,
-                            )
+            # Skip processing on first update (old_state is None on startup)
+            # This prevents adding accumulated rainfall on restart
+            if old_state is None or old_state.state in INVALID_STATES:
+                _LOGGER.debug(
+                    "Skipping precipitation update - no previous state (startup or sensor unavailable)"
+                )
+                weather.precipitation = new_precip
+                return
 
-                    state.weather.precipitation = new_precip
+            old_precip = float(old_state.state)
 
-            elif (
-                config.weather_sensors.forecast_rain_entity
-                and entity_id == config.weather_sensors.forecast_rain_entity
-            ):
-                # Forecasted rain changed - recalculate runtime for all zones
-                if new_state.state not in ("unknown", "unavailable"):
-                    try:
-                        forecast_value = float(new_state.state)
-                        _LOGGER.debug("Forecast rain updated: %.2f mm", forecast_value)
-                        # Update all zone runtime sensors since deficit calculation changed
-                        for zone_id in state.zones.keys():
-                            update_runtime_sensors(hass, entry.entry_id, zone_id)
-                    except (ValueError, TypeError):
-                        _LOGGER.warning("Invalid forecast rain value: %s", new_state.state)
-
-            # Sprinkler state changes
-            for zone_id, zone_config in config.zones.items():
-                if entity_id == zone_config.sprinkler_entity:
-                    zone_state = state.zones[zone_id]
-                    is_on = new_state.state == STATE_ON
-                    was_on = (
-                        old_state and old_state.state == STATE_ON
-                        if old_state
-                        else False
+            # If precipitation increased, add to all zones
+            precip_diff = new_precip - old_precip
+            if precip_diff > 0:
+                # Additional sanity check on the difference
+                if precip_diff > 200.0:
+                    _LOGGER.warning(
+                        "Excessive rainfall detected: %.2f mm (ignored, likely sensor error)",
+                        precip_diff,
                     )
+                    return
+
+                if _LOGGER.isEnabledFor(logging.INFO):
+                    _LOGGER.info("Rainfall detected: %.2f mm", precip_diff)
+                updates = []
+                for zone_id, zone_state in zone_items:
+                    # Add rainfall to balance (moves toward excess/positive)
+                    zone_state.soil_moisture_balance += precip_diff
+                    zone_state.last_rainfall = precip_diff
+                    updates.append((zone_id, zone_state.soil_moisture_balance))
+                update_zone_numbers(hass, entry_id, updates)
+
+            weather.precipitation = new_precip
+
+        def handle_forecast_rain(new_state: HAState, old_state: HAState | None) -> None:
+            """Recalculate runtime for all zones when forecasted rain changes."""
+            if new_state.state in INVALID_STATES:
+                return
+            try:
+                forecast_value = float(new_state.state)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Forecast rain updated: %.2f mm", forecast_value)
+                # Update all zone runtime sensors since deficit calculation changed
+                forecast_rain = max(0.0, forecast_value)
+                for zone_id, _ in zone_items:
+                    update_runtime_sensors(hass, entry_id, zone_id, forecast_rain)
+            except (ValueError, TypeError):
+                _LOGGER.warning("Invalid forecast rain value: %s", new_state.state)
+
+        def make_weather_handler(weather_attr: str) -> StateHandler:
+            """Create a handler that records readings for one weather sensor."""
+            low, high = _VALID_RANGES[weather_attr]
+
+            def handle_weather_reading(
+                new_state: HAState, old_state: HAState | None
+            ) -> None:
+                """Store the latest reading and add it to today's aggregate."""
+                stats = weather.daily_stats.get(weather_attr)
+                value = None
+                if new_state.state not in INVALID_STATES:
+                    try:
+                        value = float(new_state.state)
+                    except ValueError:
+                        pass
+                if value is None or not low <= value <= high:
+                    # The previous reading stops counting while there is no
+                    # valid one
+                    if stats is not None:
+                        stats.close(new_state.last_updated)
+                    return
+                setattr(weather, weather_attr, value)
+                if stats is None:
+                    stats = weather.daily_stats[weather_attr] = ReadingStats()
+                stats.add(value, new_state.last_updated)
+
+            return handle_weather_reading
+
+        def make_sprinkler_handler(
+            zone_id: str, zone_config: ZoneConfig
+        ) -> StateHandler:
+            """Create a state change handler bound to a single zone."""
+            zone_state = zone_states[zone_id]
+            zone_name = zone_config.name
+            precipitation_rate = zone_config.precipitation_rate
+
+            def handle_sprinkler(new_state: HAState, old_state: HAState | None) -> None:
+                """Track sprinkler on/off transitions and add applied water."""
+                is_on = new_state.state == STATE_ON
+                was_on = old_state is not None and old_state.state == STATE_ON
+
+                if is_on and not was_on:
+                    # Sprinkler turned on. Times are taken from the monotonic
+                    # clock so wall clock adjustments can't skew them
+                    zone_state.sprinkler_on_time = time.monotonic()
+                    if _LOGGER.isEnabledFor(logging.INFO):
+                        _LOGGER.info("Sprinkler turned on for zone %s", zone_name)
+                elif not is_on and was_on:
+                    # Sprinkler turned off, calculate water added
+                    if zone_state.sprinkler_on_time is not None:
+                        off_time = time.monotonic()
+                        runtime_seconds = off_time - zone_state.sprinkler_on_time
+                        zone_state.total_sprinkler_runtime_today += runtime_seconds
+
+                        # Calculate water added: (mm/hour) * (hours) = mm
+                        runtime_hours = runtime_seconds / 3600
+                        water_added = precipitation_rate * runtime_hours
+
+                        # Add water to balance (moves toward excess/positive)
+                        zone_state.soil_moisture_balance += water_added
+
+                        # Record when the valve was turned off
+                        zone_state.sprinkler_off_time = off_time
+
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug(
+                                "Sprinkler off for zone %s. Runtime: %.2f min, Water added: %.2f mm",
+                                zone_name,
+                                runtime_seconds / 60,
+                                water_added,
+                            )
 
-                    if is_on and not was_on:
-                        # Sprinkler turned on
-                        zone_state.sprinkler_on_time = datetime.now()
-                        _LOGGER.info(
-                            "Sprinkler turned on for zone %s", zone_config.name
+                        # Also refreshes the runtime sensors, which picks up the
+                        # minimum_interval constraint that now applies
+                        update_zone_number(
+                            hass,
+                            entry_id,
+                            zone_id,
+                            zone_state.soil_moisture_balance,
                         )
-                    elif not is_on and was_on:
-                        # Sprinkler turned off, calculate water added
-                        if zone_state.sprinkler_on_time:
-                            runtime_seconds = (
-                                datetime.now() - zone_state.sprinkler_on_time
-                            ).total_seconds()
-                            zone_state.total_sprinkler_runtime_today += runtime_seconds
 
-                            # Calculate water added: (mm/hour) * (hours) = mm
-                            runtime_hours = runtime_seconds / 3600
-                            water_added = zone_config.precipitation_rate * runtime_hours
+                        zone_state.sprinkler_on_time = None
 
-                            # Add water to balance (moves toward excess/positive)
-                            zone_state.soil_moisture_balance += water_added
+            return handle_sprinkler
 
-                            # Record when the valve was turned off
-                            zone_state.sprinkler_off_time = datetime.now()
+        def make_combined_handler(
+            entity_handlers: list[StateHandler],
+        ) -> StateHandler:
+            """Create a handler for an entity with several roles (e.g. a shared valve)."""
 
-                            _LOGGER.info(
-                                "Sprinkler off for zone %s. Runtime: %.2f min, Water added: %.2f mm",
-                                zone_config.name,
-                                runtime_seconds / 60,
-                                water_added,
-                            )
+            def handle_combined(
+                new_state: HAState, old_state: HAState | None
+            ) -> None:
+                for entity_handler in entity_handlers:
+                    entity_handler(new_state, old_state)
 
-                            update_zone_number(
-                                hass,
-                                entry.entry_id,
-                                zone_id,
-                                zone_state.soil_moisture_balance,
-                            )
+            return handle_combined
 
-                            # Update all runtime sensors since minimum_interval constraint now applies
-                            update_runtime_sensors(hass, entry.entry_id, zone_id)
+        # Map each tracked entity to the handlers that know what to do with it,
+        # so an entity is only subscribed once however many roles it has
+        handlers: dict[str, list[StateHandler]] = {
+            config.weather_sensors.precipitation_entity: [handle_precipitation],
+        }
+        # Precipitation takes priority if the same entity is also the forecast
+        forecast_entity = config.weather_sensors.forecast_rain_entity
+        if forecast_entity and forecast_entity not in handlers:
+            handlers[forecast_entity] = [handle_forecast_rain]
 
-                            zone_state.sprinkler_on_time = None
+        # A valve shared by several zones updates all of them
+        for zone_id, zone_config in config.zones.items():
+            handlers.setdefault(zone_config.sprinkler_entity, []).append(
+                make_sprinkler_handler(zone_id, zone_config)
+            )
 
-        # Subscribe to state changes
-        entry.async_on_unload(
-            async_track_state_change_event(hass, entity_ids, state_change_listener)
-        )
+        # Weather readings averaged for the daily ET calculation
+        for entity_attr, weather_attr, _ in _WEATHER_SENSORS:
+            if weather_attr not in DAILY_STATS_ATTRS:
+                continue
+            entity_id = getattr(config.weather_sensors, entity_attr)
+            if entity_id and entity_id not in handlers:
+                handlers[entity_id] = [make_weather_handler(weather_attr)]
+
+        def make_state_listener(
+            handler: StateHandler,
+        ) -> Callable[[Event[EventStateChangedData]], None]:
+            """Create a state change listener that calls a single handler."""
+
+            @callback
+            def state_change_listener(event: Event[EventStateChangedData]) -> None:
+                """Filter out no-op state changes before calling the handler."""
+                data = event.data
+                if (new_state := data["new_state"]) is None:
+                    return
+
+                # Attribute-only changes are no-ops for every handler: sprinklers
+                # have no on/off edge and precipitation has no difference to add
+                old_state = data["old_state"]
+                if old_state is not None and old_state.state == new_state.state:
+                    return
+
+                handler(new_state, old_state)
+
+            return state_change_listener
+
+        # Subscribe each entity to its own listener so HA routes every change
+        # straight to the right handler without re-dispatching here
+        for entity_id, entity_handlers in handlers.items():
+            if len(entity_handlers) == 1:
+                handler = entity_handlers[0]
+            else:
+                handler = make_combined_handler(entity_handlers)
+            entry.async_on_unload(
+                async_track_state_change_event(
+                    hass, entity_id, make_state_listener(handler)
+                )
+            )
 
-        # Daily midnight ET calculation
-        async def midnight_et_calculation(now: datetime) -> None:
-            """Calculate and subtract ET at midnight."""
-            _LOGGER.info("Running midnight ET calculation")
-            await calculate_and_apply_et(hass, entry.entry_id)
+        # Daily midnight ET calculation (one timer shared by all entries)
+        async_start_midnight_timer(hass)
 
-        # Track midnight for ET calculation
-        entry.async_on_unload(
-            async_track_time_change(
-                hass, midnight_et_calculation, hour=0, minute=0, second=0
-            )
+        # Load the balance snapshot before the number platform restores
+        balance_store: Store[dict] = Store(
+            hass, BALANCE_STORE_VERSION, _balance_store_key(entry_id)
         )
+        stored_balances = await balance_store.async_load()
 
         # Store entry in hass.data for platform access
         hass.data.setdefault(DOMAIN, {})
@@ -221,21 +322,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "entry": entry,
             "config": config,
             "state": state,
+            "et_lock": asyncio.Lock(),
+            "balance_store": balance_store,
+            "stored_balances": stored_balances,
         }
 
+        async def handle_stop(_event: Event) -> None:
+            """Snapshot zone balances before Home Assistant stops."""
+            await async_save_balances(hass, entry_id)
+
+        entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, handle_stop)
+        )
+
         # Register update listener for options changes
         entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
         # Forward entry setup to platforms
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+        # Periodically re-check time-based constraints for all zones at once
+        entry.async_on_unload(async_start_refresh_timer(hass, entry_id, config))
+
         # Register service for on-demand ET calculation
         async def handle_calculate_et(call):
             """Handle the calculate_et service call."""
             entry_id = call.data.get("entry_id")
             if entry_id:
                 # Calculate for specific entry
-                if entry_id in CONFIGS:
+                if entry_id in hass.data.get(DOMAIN, {}):
                     _LOGGER.info(
                         "Manual ET calculation triggered for entry %s", entry_id
                     )
@@ -245,24 +360,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             else:
                 # Calculate for all entries
                 _LOGGER.info("Manual ET calculation triggered for all entries")
-                for eid in CONFIGS:
-                    await calculate_and_apply_et(hass, eid)
+                # Start every entry's run eagerly and let them overlap on I/O
+                tasks = [
+                    hass.async_create_task(
+                        calculate_and_apply_et(hass, eid, entry_data),
+                        eager_start=True,
+                    )
+                    for eid, entry_data in list(hass.data.get(DOMAIN, {}).items())
+                ]
+                if tasks:
+                    await asyncio.gather(*tasks)
 
         hass.services.async_register(DOMAIN, "calculate_et", handle_calculate_et)
 
         _LOGGER.info("Adaptive Irrigation setup completed successfully")
         return True
 
-    except Exception as e:
-        _LOGGER.exception("Failed to set up Adaptive Irrigation: %s", e)
-        # Clean up on failure
-        CONFIGS.pop(entry.entry_id, None)
-        STATES.pop(entry.entry_id, None)
-        if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-            hass.data[DOMAIN].pop(entry.entry_id)
+    except Exception:
+        # The traceback already includes the exception message
+        _LOGGER.exception("Failed to set up Adaptive Irrigation")
+        _cleanup_entry(hass, entry.entry_id)
         raise
 
 
+@callback
+def _cleanup_entry(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove an entry's data, stopping shared resources if it was the last one."""
+    entries = hass.data.get(DOMAIN, {})
+    entries.pop(entry_id, None)
+    if not entries:
+        async_stop_midnight_timer()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -273,121 +402,233 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        await async_save_balances(hass, entry.entry_id)
         hass.data[DOMAIN].pop(entry.entry_id)
-        CONFIGS.pop(entry.entry_id, None)
-        STATES.pop(entry.entry_id, None)
 
-        # Unregister service if this is the last entry
-        if not CONFIGS and hass.services.has_service(DOMAIN, "calculate_et"):
-            hass.services.async_remove(DOMAIN, "calculate_et")
+        # Unregister service and midnight timer if this is the last entry
+        if not hass.data[DOMAIN]:
+            async_stop_midnight_timer()
+            if hass.services.has_service(DOMAIN, "calculate_et"):
+                hass.services.async_remove(DOMAIN, "calculate_et")
 
     return unload_ok
 
 
-def parse_config(entry: ConfigEntry, config: Config) -> None:
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the balance snapshot when an entry is removed."""
+    await Store(
+        hass, BALANCE_STORE_VERSION, _balance_store_key(entry.entry_id)
+    ).async_remove()
+
+
+def _balance_store_key(entry_id: str) -> str:
+    """Return the storage key for an entry's balance snapshot."""
+    return f"{DOMAIN}.{entry_id}.balances"
+
+
+async def async_save_balances(hass: HomeAssistant, entry_id: str) -> None:
+    """Save the current zone balances to the entry's store.
+
+    The save time is stored alongside so a snapshot older than the restored
+    entity state (e.g. after a crash) is not preferred over it.
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if entry_data is None:
+        return
+
+    await entry_data["balance_store"].async_save(
+        {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "balances": {
+                zone_id: zone_state.soil_moisture_balance
+                for zone_id, zone_state in entry_data["state"].zones.items()
+            },
+        }
+    )
+
+
+def _next_midnight_utc() -> datetime:
+    """Return the next local midnight as a UTC datetime."""
+    # A small margin stops a timer that fires fractionally early from
+    # rescheduling itself for the same midnight
+    now = dt_util.now() + timedelta(seconds=30)
+    return dt_util.as_utc(dt_util.start_of_local_day(now) + timedelta(days=1))
+
+
+@callback
+def async_start_midnight_timer(hass: HomeAssistant) -> None:
+    """Start the shared midnight ET timer if it is not already running.
+
+    The timer re-arms itself on each fire, recalculating local midnight so
+    DST changes are picked up. It is tracked against the wall clock and
+    records the last date it ran for, so a clock step back over midnight
+    can't apply ET twice for one day.
+    """
+    global _UNSUB_MIDNIGHT
+
+    if _UNSUB_MIDNIGHT is not None:
+        return
+
+    unsub: CALLBACK_TYPE | None = None
+    last_run_date: date_type | None = None
+
+    @callback
+    def schedule_next() -> None:
+        """Arm the timer for the next local midnight."""
+        nonlocal unsub
+        unsub = async_track_point_in_utc_time(
+            hass, midnight_et_calculation, _next_midnight_utc()
+        )
+
+    @callback
+    def midnight_et_calculation(now: datetime) -> None:
+        """Calculate and subtract ET at midnight for every entry."""
+        nonlocal last_run_date
+        schedule_next()
+        today = dt_util.as_local(now).date()
+        if today == last_run_date:
+            _LOGGER.debug("Midnight ET calculation already ran for %s", today)
+            return
+        last_run_date = today
+        _LOGGER.info("Running midnight ET calculation")
+        for entry_id, entry_data in list(hass.data.get(DOMAIN, {}).items()):
+            hass.async_create_task(
+                calculate_and_apply_et(hass, entry_id, entry_data), eager_start=True
+            )
+
+    @callback
+    def cancel() -> None:
+        """Cancel the pending timer."""
+        if unsub is not None:
+            unsub()
+
+    schedule_next()
+    _UNSUB_MIDNIGHT = cancel
+
+
+@callback
+def async_start_refresh_timer(
+    hass: HomeAssistant, entry_id: str, config: Config
+) -> CALLBACK_TYPE:
+    """Start an entry's periodic zone refresh and return a function to stop it.
+
+    All zones are recalculated in one pass per tick (so the forecast is read
+    once) rather than each zone entity running its own timer.
+    """
+    handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def refresh() -> None:
+        """Recalculate every zone and re-arm the timer."""
+        nonlocal handle
+        handle = hass.loop.call_later(REFRESH_INTERVAL, refresh)
+        forecast_rain = get_forecast_rain(hass, config)
+        for zone_id in config.zones:
+            update_runtime_sensors(hass, entry_id, zone_id, forecast_rain)
+
+    @callback
+    def cancel() -> None:
+        """Cancel the pending timer."""
+        if handle is not None:
+            handle.cancel()
+
+    handle = hass.loop.call_later(REFRESH_INTERVAL, refresh)
+    return cancel
+
+
+@callback
+def async_stop_midnight_timer() -> None:
+    """Stop the shared midnight ET timer."""
+    global _UNSUB_MIDNIGHT
+
+    if _UNSUB_MIDNIGHT is not None:
+        _UNSUB_MIDNIGHT()
+        _UNSUB_MIDNIGHT = None
+
+
+# Config entry keys and defaults used to build the weather sensor config
+_WEATHER_FIELDS = (
+    ("temperature_entity", None),
+    ("humidity_entity", None),
+    ("precipitation_entity", None),
+    ("wind_speed_entity", None),
+    ("solar_radiation_entity", None),
+    ("pressure_entity", None),
+    ("forecast_rain_entity", None),
+    ("latitude", 0.0),
+    ("longitude", 0.0),
+    ("elevation", 0.0),
+)
+
+# Zone keys and defaults used to build each zone config
+_ZONE_FIELDS = (
+    ("sprinkler_entity", None),
+    ("precipitation_rate", 10.0),
+    ("crop_coefficient", 1.0),
+    ("max_runtime", 3600),
+    ("min_runtime", 60),
+    ("minimum_interval", 3600),
+    ("max_balance", 50.0),
+    ("min_balance", -50.0),
+    ("drainage_rate", 1.0),
+)
+
+
+def parse_config(entry: ConfigEntry) -> Config:
     """Parse configuration from config entry."""
     config_data = {**entry.data, **entry.options}
 
     # Weather sensors
-    weather_config = WeatherSensorConfig()
-    weather_config.temperature_entity = config_data.get("temperature_entity")
-    weather_config.humidity_entity = config_data.get("humidity_entity")
-    weather_config.precipitation_entity = config_data.get("precipitation_entity")
-    weather_config.wind_speed_entity = config_data.get("wind_speed_entity")
-    weather_config.solar_radiation_entity = config_data.get("solar_radiation_entity")
-    weather_config.pressure_entity = config_data.get("pressure_entity")
-    weather_config.forecast_rain_entity = config_data.get("forecast_rain_entity")
-    weather_config.latitude = config_data.get("latitude", 0.0)
-    weather_config.longitude = config_data.get("longitude", 0.0)
-    weather_config.elevation = config_data.get("elevation", 0.0)
-    config.weather_sensors = weather_config
+    weather_config = WeatherSensorConfig(
+        **{key: config_data.get(key, default) for key, default in _WEATHER_FIELDS}
+    )
 
     # Auto-select ET method based on available sensors
     if weather_config.wind_speed_entity and weather_config.solar_radiation_entity:
         # Penman-Monteith: most accurate, requires wind and solar
-        config.et_method = "penman_monteith"
+        et_method = "penman_monteith"
         _LOGGER.info("Using Penman-Monteith ET method (wind & solar available)")
     elif weather_config.solar_radiation_entity:
         # Priestley-Taylor: requires solar radiation
-        config.et_method = "priestley_taylor"
+        et_method = "priestley_taylor"
         _LOGGER.info("Using Priestley-Taylor ET method (solar available)")
     else:
         # Hargreaves: simplest, requires only temperature
-        config.et_method = "hargreaves"
+        et_method = "hargreaves"
         _LOGGER.info("Using Hargreaves ET method (minimal sensors)")
 
     # Zones
+    zones: dict[str, ZoneConfig] = {}
     zones_data = config_data.get("zones", [])
     for idx, zone_data in enumerate(zones_data):
-        zone_id = f"zone_{idx}"
-        zone_config = ZoneConfig()
-        zone_config.name = zone_data.get("name", f"Zone {idx + 1}")
-        zone_config.zone_id = zone_id
-        zone_config.sprinkler_entity = zone_data.get("sprinkler_entity")
-        zone_config.precipitation_rate = zone_data.get("precipitation_rate", 10.0)
-        zone_config.crop_coefficient = zone_data.get("crop_coefficient", 1.0)
-        zone_config.max_runtime = zone_data.get("max_runtime", 3600)
-        zone_config.min_runtime = zone_data.get("min_runtime", 60)
-        zone_config.minimum_interval = zone_data.get("minimum_interval", 3600)
-        zone_config.max_balance = zone_data.get("max_balance", 50.0)
-        zone_config.min_balance = zone_data.get("min_balance", -50.0)
-        zone_config.drainage_rate = zone_data.get("drainage_rate", 1.0)
-        config.zones[zone_id] = zone_config
+        zone_id = sys.intern(f"zone_{idx}")
+        zones[zone_id] = ZoneConfig(
+            name=zone_data.get("name", f"Zone {idx + 1}"),
+            zone_id=zone_id,
+            **{key: zone_data.get(key, default) for key, default in _ZONE_FIELDS},
+        )
+
+    # Config is immutable, so it is built once everything is known
+    return Config(weather_sensors=weather_config, zones=zones, et_method=et_method)
 
 
 def initialise_state(hass: HomeAssistant, config: Config, state: State) -> None:
     """Initialize state from current entity values."""
     # Initialize weather state
-    temp_state = hass.states.get(config.weather_sensors.temperature_entity)
-    if temp_state and temp_state.state not in ("unknown", "unavailable"):
-        value = float(temp_state.state)
-        if is_valid_temperature(value):
-            state.weather.temperature = value
-        else:
-            _LOGGER.warning("Invalid initial temperature: %.2f °C", value)
-
-    humidity_state = hass.states.get(config.weather_sensors.humidity_entity)
-    if humidity_state and humidity_state.state not in ("unknown", "unavailable"):
-        value = float(humidity_state.state)
-        if is_valid_humidity(value):
-            state.weather.humidity = value
-        else:
-            _LOGGER.warning("Invalid initial humidity: %.2f%%", value)
-
-    precip_state = hass.states.get(config.weather_sensors.precipitation_entity)
-    if precip_state and precip_state.state not in ("unknown", "unavailable"):
-        value = float(precip_state.state)
-        if is_valid_precipitation(value):
-            state.weather.precipitation = value
-        else:
-            _LOGGER.warning("Invalid initial precipitation: %.2f mm", value)
-
-    if config.weather_sensors.wind_speed_entity:
-        wind_state = hass.states.get(config.weather_sensors.wind_speed_entity)
-        if wind_state and wind_state.state not in ("unknown", "unavailable"):
-            value = float(wind_state.state)
-            if is_valid_wind_speed(value):
-                state.weather.wind_speed = value
-            else:
-                _LOGGER.warning("Invalid initial wind speed: %.2f km/h", value)
-
-    if config.weather_sensors.solar_radiation_entity:
-        solar_state = hass.states.get(config.weather_sensors.solar_radiation_entity)
-        if solar_state and solar_state.state not in ("unknown", "unavailable"):
-            value = float(solar_state.state)
-            if is_valid_solar_radiation(value):
-                state.weather.solar_radiation = value
+    for entity_attr, weather_attr, message in _WEATHER_SENSORS:
+        entity_id = getattr(config.weather_sensors, entity_attr)
+        if not entity_id:
+            continue
+        entity_state = hass.states.get(entity_id)
+        if entity_state and entity_state.state not in INVALID_STATES:
+            value = float(entity_state.state)
+            if _in_range(weather_attr, value):
+                setattr(state.weather, weather_attr, value)
             else:
-                _LOGGER.warning("Invalid initial solar radiation: %.2f W/m²", value)
+                _LOGGER.warning(message, value)
 
-    if config.weather_sensors.pressure_entity:
-        pressure_state = hass.states.get(config.weather_sensors.pressure_entity)
-        if pressure_state and pressure_state.state not in ("unknown", "unavailable"):
-            value = float(pressure_state.state)
-            if is_valid_pressure(value):
-                state.weather.pressure = value
-            else:
-                _LOGGER.warning("Invalid initial pressure: %.2f hPa", value)
+    # Readings from here on are accumulated as they arrive
+    state.weather.reset_daily_stats(dt_util.now())
 
     # Initialize zone states
     for zone_id, zone_config in config.zones.items():
@@ -396,131 +637,465 @@ def initialise_state(hass: HomeAssistant, config: Config, state: State) -> None:
         state.zones[zone_id] = zone_state
 
 
-def is_valid_temperature(value: float) -> bool:
-    """Check if temperature value is within reasonable bounds."""
-    return value is not None and -50.0 <= value <= 60.0
-
-
-def is_valid_humidity(value: float) -> bool:
-    """Check if humidity value is within valid range."""
-    return value is not None and 0.0 <= value <= 100.0
-
+# Plausible sensor ranges, keyed by weather state attribute
+_VALID_RANGES: dict[str, tuple[float, float]] = {
+    "temperature": (-50.0, 60.0),  # °C
+    "humidity": (0.0, 100.0),  # %
+    "wind_speed": (0.0, 200.0),  # km/h (reasonable maximum for surface weather)
+    "solar_radiation": (0.0, 1500.0),  # W/m² (max solar constant ~1361 W/m² plus atmosphere)
+    "pressure": (800.0, 1100.0),  # hPa (covers extreme weather conditions)
+    "precipitation": (0.0, 500.0),  # mm/day (extreme rainfall, but possible)
+}
+
+
+def _in_range(weather_attr: str, value: float) -> bool:
+    """Check a value against the plausible range for a weather attribute."""
+    low, high = _VALID_RANGES[weather_attr]
+    return value is not None and low <= value <= high
+
+
+# Weather sensors read at startup:
+# (config entity attribute, weather state attribute, invalid message)
+_WEATHER_SENSORS = (
+    ("temperature_entity", "temperature", "Invalid initial temperature: %.2f °C"),
+    ("humidity_entity", "humidity", "Invalid initial humidity: %.2f%%"),
+    ("precipitation_entity", "precipitation", "Invalid initial precipitation: %.2f mm"),
+    ("wind_speed_entity", "wind_speed", "Invalid initial wind speed: %.2f km/h"),
+    ("solar_radiation_entity", "solar_radiation", "Invalid initial solar radiation: %.2f W/m²"),
+    ("pressure_entity", "pressure", "Invalid initial pressure: %.2f hPa"),
+)
 
-def is_valid_wind_speed(value: float) -> bool:
-    """Check if wind speed is within reasonable bounds."""
-    return value is not None and 0.0 <= value <= 200.0  # km/h (reasonable maximum for surface weather)
 
+def _aggregate_statistics(
+    hass: HomeAssistant,
+    entity_id: str,
+    start_time: datetime,
+    end_time: datetime,
+    bounds: tuple[float, float] | None,
+) -> tuple[ReadingStats, int, list[tuple[datetime, datetime]]] | None:
+    """Aggregate a sensor's hourly long-term statistics (blocking).
+
+    Returns the aggregate, the number of hours whose mean was outside the
+    bounds and the spans the statistics do not cover (e.g. the hour not yet
+    compiled at midnight), or None when the sensor has no statistics (no
+    state_class) so the caller can use raw history.
+    """
+    statistics = statistics_during_period(
+        hass,
+        start_time,
+        end_time,
+        {entity_id},
+        "hour",
+        None,
+        {"mean", "min", "max"},
+    )
+    rows = statistics.get(entity_id)
+    if not rows:
+        return None
+
+    stats = ReadingStats()
+    filtered_hours = 0
+    gaps: list[tuple[float, float]] = []
+    covered_until = start_time.timestamp()
+    low, high = bounds if bounds is not None else (-math.inf, math.inf)
+    for row in rows:
+        mean = row.get("mean")
+        if mean is None:
+            continue  # Left as a gap to fill from history
+        if row["start"] > covered_until:
+            gaps.append((covered_until, row["start"]))
+        covered_until = row["end"]
+        # Skip hours whose mean is implausible; otherwise only clamp the
+        # extremes so a single bad reading doesn't drop a valid hour
+        if not low <= mean <= high:
+            filtered_hours += 1
+            continue
+        minimum = row.get("min")
+        maximum = row.get("max")
+        stats.add_period(
+            mean,
+            mean if minimum is None else max(minimum, low),
+            mean if maximum is None else min(maximum, high),
+            (row["end"] - row["start"]) / 3600,
+        )
+    if covered_until < end_time.timestamp():
+        gaps.append((covered_until, end_time.timestamp()))
 
-def is_valid_solar_radiation(value: float) -> bool:
-    """Check if solar radiation is within reasonable bounds."""
     return (
-        value is not None and 0.0 <= value <= 1500.0
-    )  # W/m² (max solar constant ~1361 W/m² plus atmosphere)
-
-
-def is_valid_pressure(value: float) -> bool:
-    """Check if pressure is within reasonable atmospheric range."""
-    return value is not None and 800.0 <= value <= 1100.0  # hPa (covers extreme weather conditions)
-
-
-def is_valid_precipitation(value: float) -> bool:
-    """Check if precipitation is within reasonable bounds."""
-    return value is not None and 0.0 <= value <= 500.0  # mm/day (extreme rainfall, but possible)
+        stats,
+        filtered_hours,
+        [
+            (dt_util.utc_from_timestamp(gap_start), dt_util.utc_from_timestamp(gap_end))
+            for gap_start, gap_end in gaps
+        ],
+    )
 
 
-async def get_historical_weather_data(
+def _aggregate_states(
     hass: HomeAssistant,
     entity_id: str,
     start_time: datetime,
     end_time: datetime,
-    validator=None,
-) -> list[float]:
-    """Get historical sensor data from the database with optional validation."""
-    states = await recorder.get_instance(hass).async_add_executor_job(
-        history.state_changes_during_period,
+    bounds: tuple[float, float] | None,
+) -> tuple[ReadingStats, int]:
+    """Aggregate a sensor's raw state history (blocking).
+
+    Returns the time-weighted aggregate and the number of readings outside
+    the bounds.
+    """
+    states = history.state_changes_during_period(
         hass,
         start_time,
         end_time,
         entity_id,
-        True,  # include_start_time_state
-        True,  # significant_changes_only
-        1000,  # minimal_response - limit number of results
+        no_attributes=True,
+        include_start_time_state=True,
     )
 
+    stats = ReadingStats()
+    filtered_count = 0
     if not states or entity_id not in states:
-        return []
+        return stats, filtered_count
 
-    values = []
-    filtered_count = 0
+    low, high = bounds if bounds is not None else (-math.inf, math.inf)
     for state in states[entity_id]:
-        if state.state not in ("unknown", "unavailable", "None"):
+        # The start-of-period state may have been set before the period
+        when = max(state.last_updated, start_time)
+        raw = state.state
+        value = None
+        if raw not in _INVALID_HISTORY_STATES:
             try:
-                value = float(state.state)
-                # Apply validation if provided
-                if validator is None or validator(value):
-                    values.append(value)
-                else:
-                    filtered_count += 1
-                    _LOGGER.debug(
-                        "Filtered invalid sensor value: %.2f from %s", value, entity_id
-                    )
+                value = float(raw)
             except (ValueError, TypeError):
-                continue
+                pass
+        # Skip readings outside the plausible range; like unavailable
+        # states, they end the previous reading
+        if value is not None and low <= value <= high:
+            stats.add(value, when)
+        else:
+            if value is not None:
+                filtered_count += 1
+            stats.close(when)
+    stats.close(end_time)
 
-    if filtered_count > 0:
-        _LOGGER.info("Filtered %d invalid readings from %s", filtered_count, entity_id)
+    return stats, filtered_count
 
-    return values
 
+def _aggregate_history(
+    hass: HomeAssistant,
+    entity_id: str,
+    start_time: datetime,
+    end_time: datetime,
+    bounds: tuple[float, float] | None,
+) -> tuple[ReadingStats, int, int]:
+    """Query and aggregate sensor history (blocking, run in the recorder executor).
+
+    Returns the time-weighted aggregate, the number of raw readings and the
+    number of statistics hours outside the bounds. Hourly statistics are
+    used when the recorder has them, since they are a handful of rows
+    instead of every state change. Spans they don't cover (such as the hour
+    not compiled yet at midnight) are filled from raw history, each weighted
+    by its length.
+    """
+    result = _aggregate_statistics(hass, entity_id, start_time, end_time, bounds)
+    if result is None:
+        stats, filtered_readings = _aggregate_states(
+            hass, entity_id, start_time, end_time, bounds
+        )
+        return stats, filtered_readings, 0
+
+    stats, filtered_hours, gaps = result
+    filtered_readings = 0
+    for gap_start, gap_end in gaps:
+        gap, gap_filtered = _aggregate_states(
+            hass, entity_id, gap_start, gap_end, bounds
+        )
+        if gap.hours > 0:
+            stats.add_period(gap.mean, gap.minimum, gap.maximum, gap.hours)
+        filtered_readings += gap_filtered
+
+    return stats, filtered_readings, filtered_hours
+
+
+async def get_historical_weather_data(
+    hass: HomeAssistant,
+    entity_id: str,
+    start_time: datetime,
+    end_time: datetime,
+    bounds: tuple[float, float] | None = None,
+) -> ReadingStats:
+    """Aggregate historical sensor data from the database with optional validation."""
+    # Parse and reduce the rows in the executor alongside the query, so the
+    # event loop only receives the final aggregate
+    (
+        stats,
+        filtered_readings,
+        filtered_hours,
+    ) = await recorder.get_instance(hass).async_add_executor_job(
+        _aggregate_history, hass, entity_id, start_time, end_time, bounds
+    )
+
+    if filtered_readings > 0:
+        _LOGGER.info(
+            "Filtered %d invalid readings from %s", filtered_readings, entity_id
+        )
+    if filtered_hours > 0:
+        _LOGGER.info(
+            "Filtered %d hours of invalid statistics from %s", filtered_hours, entity_id
+        )
+
+    return stats
+
+
+def _import_et_modules() -> tuple[ModuleType, ModuleType]:
+    """Import pandas and pyet (blocking, run in the executor)."""
+    import pandas
+    import pyet
+
+    return pandas, pyet
+
+
+async def async_load_et_modules(
+    hass: HomeAssistant,
+) -> tuple[ModuleType, ModuleType] | None:
+    """Return (pandas, pyet), importing them on first use.
+
+    A failed import is remembered so it is not retried every midnight.
+    """
+    global _ET_MODULES
+
+    if _ET_MODULES is None:
+        try:
+            _ET_MODULES = await hass.async_add_import_executor_job(
+                _import_et_modules
+            )
+        except ImportError:
+            _LOGGER.exception("Failed to import pyet")
+            _ET_MODULES = False
+
+    return _ET_MODULES or None
+
+
+@lru_cache(maxsize=4)
+def _single_day_index(pd: ModuleType, date: date_type):
+    """Return a one-day DatetimeIndex, shared by every entry run for that date."""
+    return pd.date_range(date, periods=1, freq="D")
+
+
+def compute_et0(
+    et_method: str,
+    date: date_type,
+    lat: float,
+    elevation: float,
+    temp_avg: float,
+    temp_max: float,
+    temp_min: float,
+    humidity_avg: float,
+    humidity_max: float,
+    humidity_min: float,
+    wind_avg_ms: float | None,
+    solar_avg_mj: float | None,
+    pressure_avg_kpa: float | None,
+) -> float:
+    """Calculate reference ET (mm/day) for one day of weather inputs.
+
+    Falls back to Hargreaves (with a warning) when pyet or the inputs for
+    the configured method are missing, then runs the cached calculation.
+    pyet must already be loaded with async_load_et_modules for
+    Penman-Monteith/Priestley-Taylor.
+    """
+    if et_method in ("penman_monteith", "priestley_taylor"):
+        if not _ET_MODULES:
+            _LOGGER.warning("pyet is unavailable, using Hargreaves")
+            et_method = "hargreaves"
+        elif et_method == "penman_monteith":
+            # Requires more data
+            if wind_avg_ms is None or solar_avg_mj is None:
+                _LOGGER.warning(
+                    "Insufficient data for Penman-Monteith, using Hargreaves"
+                )
+                et_method = "hargreaves"
+            else:
+                _LOGGER.debug(
+                    "Calling pyet.pm_fao56 with: tmean=%s, tmax=%s, tmin=%s, wind=%s, rs=%s, rh=%s, elevation=%s, pressure=%s, lat=%s",
+                    temp_avg,
+                    temp_max,
+                    temp_min,
+                    wind_avg_ms,
+                    solar_avg_mj,
+                    humidity_avg,
+                    elevation,
+                    pressure_avg_kpa,
+                    lat,
+                )
+        elif solar_avg_mj is None:
+            _LOGGER.warning("Insufficient data for Priestley-Taylor, using Hargreaves")
+            et_method = "hargreaves"
+
+    return _compute_et0(
+        et_method,
+        date,
+        lat,
+        elevation,
+        temp_avg,
+        temp_max,
+        temp_min,
+        humidity_avg,
+        humidity_max,
+        humidity_min,
+        wind_avg_ms,
+        solar_avg_mj,
+        pressure_avg_kpa,
+    )
 
-async def calculate_and_apply_et(hass: HomeAssistant, entry_id: str) -> None:
-    """Calculate ET using pyet and subtract from soil moisture."""
-    config = CONFIGS[entry_id]
-    state = STATES[entry_id]
+
+@lru_cache(maxsize=64)
+def _compute_et0(
+    et_method: str,
+    date: date_type,
+    lat: float,
+    elevation: float,
+    temp_avg: float,
+    temp_max: float,
+    temp_min: float,
+    humidity_avg: float,
+    humidity_max: float,
+    humidity_min: float,
+    wind_avg_ms: float | None,
+    solar_avg_mj: float | None,
+    pressure_avg_kpa: float | None,
+) -> float:
+    """Run the ET calculation for an already validated method.
+
+    Results are cached by their inputs, so entries sharing the same weather
+    sensors and location only run pyet once per day.
+    """
+    if et_method == "penman_monteith":
+        pd, pyet = _ET_MODULES
+        # pyet works on daily series, so inputs share a single-day index
+        index = _single_day_index(pd, date)
+        # Pass pressure if available, otherwise let pyet calculate from elevation
+        et0 = pyet.pm_fao56(
+            tmean=pd.Series([temp_avg], index=index),
+            wind=pd.Series([wind_avg_ms], index=index),
+            rs=pd.Series([solar_avg_mj], index=index),
+            rh=pd.Series([humidity_avg], index=index),
+            rhmax=pd.Series([humidity_max], index=index),
+            rhmin=pd.Series([humidity_min], index=index),
+            tmax=pd.Series([temp_max], index=index),
+            tmin=pd.Series([temp_min], index=index),
+            elevation=elevation,
+            pressure=(
+                pd.Series([pressure_avg_kpa], index=index)
+                if pressure_avg_kpa is not None
+                else None
+            ),
+            lat=lat,
+        )
+        return float(et0.iloc[0]) if not et0.empty else 0.0
+
+    if et_method == "priestley_taylor":
+        pd, pyet = _ET_MODULES
+        index = _single_day_index(pd, date)
+        et0 = pyet.priestley_taylor(
+            pd.Series([temp_avg], index=index),
+            pd.Series([solar_avg_mj], index=index),
+            elevation=elevation,
+            lat=lat,
+        )
+        return float(et0.iloc[0]) if not et0.empty else 0.0
+
+    # Hargreaves (default/fallback) only needs temperatures, so it is
+    # calculated directly without building pandas objects
+    return calculate_hargreaves_et0(
+        temp_avg, temp_max, temp_min, lat, date.timetuple().tm_yday
+    )
+
+
+async def calculate_and_apply_et(
+    hass: HomeAssistant, entry_id: str, entry_data: dict | None = None
+) -> None:
+    """Calculate ET using pyet and subtract from soil moisture.
+
+    Runs at most once at a time per entry; a run requested while another is
+    in progress (e.g. a service call at midnight) is skipped so ET is never
+    applied twice. Callers already iterating hass.data can pass the entry
+    data to skip the lookup.
+    """
+    if entry_data is None:
+        entry_data = hass.data[DOMAIN][entry_id]
+    et_lock: asyncio.Lock = entry_data["et_lock"]
+
+    if et_lock.locked():
+        _LOGGER.info("ET calculation already running for entry %s, skipping", entry_id)
+        return
+
+    async with et_lock:
+        await _async_calculate_and_apply_et(
+            hass, entry_id, entry_data["config"], entry_data["state"]
+        )
+
+
+async def _async_calculate_and_apply_et(
+    hass: HomeAssistant, entry_id: str, config: Config, state: State
+) -> None:
+    """Calculate ET for the previous day and apply it to all zones."""
 
     # Query the previous day's data from database (use timezone-aware datetime)
     now = dt_util.now()
     end_time = dt_util.start_of_local_day(now)
     start_time = end_time - timedelta(days=1)
 
-    _LOGGER.info("Fetching weather data from %s to %s", start_time, end_time)
+    # Readings accumulated from state changes only cover the previous day if
+    # collection started at its beginning (the last midnight run); otherwise,
+    # e.g. on the first run after startup, fall back to the recorder
+    weather = state.weather
+    daily_stats: dict[str, ReadingStats] | None = None
+    if weather.daily_stats_start is not None and weather.daily_stats_start < end_time:
+        collected_from = weather.daily_stats_start
+        previous_stats = weather.reset_daily_stats(end_time)
+        if collected_from == start_time:
+            daily_stats = previous_stats
+
+    async def get_daily_stats(weather_attr: str, entity_id: str) -> ReadingStats:
+        """Return the previous day's readings for one sensor."""
+        if daily_stats is not None and weather_attr in daily_stats:
+            return daily_stats[weather_attr]
+        _LOGGER.info(
+            "Fetching %s history from %s to %s", entity_id, start_time, end_time
+        )
+        return await get_historical_weather_data(
+            hass, entity_id, start_time, end_time, _VALID_RANGES[weather_attr]
+        )
 
-    # Fetch historical data for all sensors with validation
-    temp_data = await get_historical_weather_data(
-        hass,
-        config.weather_sensors.temperature_entity,
-        start_time,
-        end_time,
-        is_valid_temperature,
+    # Fetch data for all sensors with validation
+    temp_stats = await get_daily_stats(
+        "temperature", config.weather_sensors.temperature_entity
     )
-    if len(temp_data) == 0:
+    if temp_stats.count == 0:
         _LOGGER.warning("Missing required temperature data for ET calculation")
         return
 
-    humidity_data = await get_historical_weather_data(
-        hass,
-        config.weather_sensors.humidity_entity,
-        start_time,
-        end_time,
-        is_valid_humidity,
+    humidity_stats = await get_daily_stats(
+        "humidity", config.weather_sensors.humidity_entity
     )
-    if len(humidity_data) == 0:
+    if humidity_stats.count == 0:
         _LOGGER.warning("Missing required relative humidity data for ET calculation")
         return
 
     _LOGGER.info(
-        "Retrieved %d temperature and %d humidity readings from database",
-        len(temp_data),
-        len(humidity_data),
+        "Retrieved %d temperature and %d humidity readings",
+        temp_stats.count,
+        humidity_stats.count,
     )
 
     # Calculate averages (temperature must be in Celsius for pyet)
-    temp_avg = sum(temp_data) / len(temp_data)
-    temp_max = max(temp_data)
-    temp_min = min(temp_data)
-    humidity_avg = sum(humidity_data) / len(humidity_data)
-    humidity_max = max(humidity_data)
-    humidity_min = min(humidity_data)
+    temp_avg = temp_stats.mean
+    temp_max = temp_stats.maximum
+    temp_min = temp_stats.minimum
+    humidity_avg = humidity_stats.mean
+    humidity_max = humidity_stats.maximum
+    humidity_min = humidity_stats.minimum
 
     # Validate averages are not None
     if temp_avg is None or humidity_avg is None:
@@ -531,147 +1106,81 @@ async def calculate_and_apply_et(hass: HomeAssistant, entry_id: str) -> None:
         )
         return
 
-    # Create dataframe for pyet (requires daily data)
-    date = (datetime.now() - timedelta(days=1)).date()
-
-    df = pd.DataFrame(
-        {
-            "tmean": [float(temp_avg)],
-            "tmax": [float(temp_max)],
-            "tmin": [float(temp_min)],
-            "rh": [float(humidity_avg)],
-            "rhmax": [float(humidity_max)],
-            "rhmin": [float(humidity_min)],
-        },
-        index=pd.DatetimeIndex([pd.Timestamp(date)]),
-    )
+    date = start_time.date()
 
     # Add optional parameters if available
+    wind_avg_ms = None
     if config.weather_sensors.wind_speed_entity:
-        wind_data = await get_historical_weather_data(
-            hass,
-            config.weather_sensors.wind_speed_entity,
-            start_time,
-            end_time,
-            is_valid_wind_speed,
+        wind_stats = await get_daily_stats(
+            "wind_speed", config.weather_sensors.wind_speed_entity
         )
-        if len(wind_data) > 0:
+        if wind_stats.count > 0:
             # Convert km/h to m/s (pyet expects m/s)
             # km/h ÷ 3.6 = m/s
-            wind_avg_kmh = sum(wind_data) / len(wind_data)
+            wind_avg_kmh = wind_stats.mean
             wind_avg_ms = wind_avg_kmh / 3.6
-            df["wind"] = [wind_avg_ms]
             _LOGGER.debug(
                 "Wind speed average: %.2f km/h (%.2f m/s) from %d readings",
                 wind_avg_kmh,
                 wind_avg_ms,
-                len(wind_data),
+                wind_stats.count,
             )
 
+    solar_avg_mj = None
     if config.weather_sensors.solar_radiation_entity:
-        solar_data = await get_historical_weather_data(
-            hass,
-            config.weather_sensors.solar_radiation_entity,
-            start_time,
-            end_time,
-            is_valid_solar_radiation,
+        solar_stats = await get_daily_stats(
+            "solar_radiation", config.weather_sensors.solar_radiation_entity
         )
-        if len(solar_data) > 0:
+        if solar_stats.count > 0:
             # Convert W/m² (average) to MJ/m²/day (pyet expects MJ/m²/day)
             # W/m² × 0.0864 = MJ/m²/day
-            solar_avg_wm2 = sum(solar_data) / len(solar_data)
+            solar_avg_wm2 = solar_stats.mean
             solar_avg_mj = solar_avg_wm2 * 0.0864
-            df["rs"] = [solar_avg_mj]
             _LOGGER.debug(
                 "Solar radiation average: %.2f W/m² (%.2f MJ/m²/day) from %d readings",
                 solar_avg_wm2,
                 solar_avg_mj,
-                len(solar_data),
+                solar_stats.count,
             )
 
+    pressure_avg_kpa = None
     if config.weather_sensors.pressure_entity:
-        pressure_data = await get_historical_weather_data(
-            hass,
-            config.weather_sensors.pressure_entity,
-            start_time,
-            end_time,
-            is_valid_pressure,
+        pressure_stats = await get_daily_stats(
+            "pressure", config.weather_sensors.pressure_entity
         )
-        if len(pressure_data) > 0:
+        if pressure_stats.count > 0:
             # Convert hPa to kPa (pyet expects kPa)
-            pressure_avg_hpa = sum(pressure_data) / len(pressure_data)
+            pressure_avg_hpa = pressure_stats.mean
             pressure_avg_kpa = pressure_avg_hpa / 10.0
-            df["pressure"] = [pressure_avg_kpa]
             _LOGGER.debug(
                 "Pressure average: %.2f hPa (%.2f kPa) from %d readings",
                 pressure_avg_hpa,
                 pressure_avg_kpa,
-                len(pressure_data),
+                pressure_stats.count,
             )
 
     try:
-        # Calculate ET based on selected method
-        lat = config.weather_sensors.latitude
-        elevation = config.weather_sensors.elevation
+        if config.et_method in ("penman_monteith", "priestley_taylor"):
+            # pyet is imported in the executor before the synchronous calculation
+            await async_load_et_modules(hass)
 
-        # Debug log DataFrame contents
-        _LOGGER.debug("DataFrame for ET calculation: %s", df.to_dict())
-        _LOGGER.debug("tmean: %s, rh: %s", df["tmean"].iloc[0], df["rh"].iloc[0])
+        _LOGGER.debug("tmean: %s, rh: %s", temp_avg, humidity_avg)
 
-        if config.et_method == "penman_monteith":
-            # Requires more data
-            if "wind" in df.columns and "rs" in df.columns:
-                # Pass pressure if available, otherwise let pyet calculate from elevation
-                pressure_param = df["pressure"] if "pressure" in df.columns else None
-                _LOGGER.debug(
-                    "Calling pyet.pm_fao56 with: tmean=%s, tmax=%s, tmin=%s, wind=%s, rs=%s, rh=%s, elevation=%s, pressure=%s, lat=%s",
-                    df["tmean"].iloc[0],
-                    df["tmax"].iloc[0],
-                    df["tmin"].iloc[0],
-                    df["wind"].iloc[0],
-                    df["rs"].iloc[0],
-                    df["rh"].iloc[0],
-                    elevation,
-                    pressure_param.iloc[0] if pressure_param is not None else None,
-                    lat,
-                )
-                et0 = pyet.pm_fao56(
-                    tmean=df["tmean"],
-                    wind=df["wind"],
-                    rs=df["rs"],
-                    rh=df["rh"],
-                    rhmax=df["rhmax"],
-                    rhmin=df["rhmin"],
-                    tmax=df["tmax"],
-                    tmin=df["tmin"],
-                    elevation=elevation,
-                    pressure=pressure_param,
-                    lat=lat,
-                )
-            else:
-                _LOGGER.warning(
-                    "Insufficient data for Penman-Monteith, using Hargreaves"
-                )
-                et0 = pyet.hargreaves(
-                    df["tmean"], max(temp_data), min(temp_data), lat=lat
-                )
-        elif config.et_method == "priestley_taylor":
-            if "rs" in df.columns:
-                et0 = pyet.priestley_taylor(
-                    df["tmean"], df["rs"], elevation=elevation, lat=lat
-                )
-            else:
-                _LOGGER.warning(
-                    "Insufficient data for Priestley-Taylor, using Hargreaves"
-                )
-                et0 = pyet.hargreaves(
-                    df["tmean"], max(temp_data), min(temp_data), lat=lat
-                )
-        else:  # hargreaves (default/fallback)
-            et0 = pyet.hargreaves(df["tmean"], max(temp_data), min(temp_data), lat=lat)
-
-        # Get the ET value (in mm)
-        et_mm = float(et0.iloc[0]) if not et0.empty else 0.0
+        et_mm = compute_et0(
+            config.et_method,
+            date,
+            config.weather_sensors.latitude,
+            config.weather_sensors.elevation,
+            temp_avg,
+            temp_max,
+            temp_min,
+            humidity_avg,
+            humidity_max,
+            humidity_min,
+            wind_avg_ms,
+            solar_avg_mj,
+            pressure_avg_kpa,
+        )
 
         _LOGGER.debug("Calculated ET0: %.2f mm/day", et_mm)
 
@@ -679,144 +1188,163 @@ async def calculate_and_apply_et(hass: HomeAssistant, entry_id: str) -> None:
         update_et0_sensor(hass, entry_id, et_mm)
 
         # Apply ET to all zones with crop coefficient
+        zone_states = state.zones
+        updates = []
         for zone_id, zone_config in config.zones.items():
-            zone_state = state.zones[zone_id]
+            zone_state = zone_states[zone_id]
 
             # Apply crop coefficient
             et_actual = et_mm * zone_config.crop_coefficient
 
-            # Get drainage rate (default to 1.0 mm/day if not configured)
-            drainage_rate = getattr(zone_config, "drainage_rate", 1.0)
+            # ZoneConfig always carries a drainage rate (1.0 mm/day by default)
+            drainage_rate = zone_config.drainage_rate
 
             # Subtract ET and drainage from balance (moves toward deficit/negative)
             zone_state.soil_moisture_balance -= et_actual + drainage_rate
             zone_state.last_et = et_actual
-            zone_state.last_et_calculation = datetime.now()
+            zone_state.last_et_calculation = now
             zone_state.total_sprinkler_runtime_today = 0.0  # Reset daily counter
 
-            _LOGGER.debug(
-                "Zone %s: ET=%.2f mm, Drainage=%.2f mm, New balance=%.2f mm",
-                zone_config.name,
-                et_actual,
-                drainage_rate,
-                zone_state.soil_moisture_balance,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Zone %s: ET=%.2f mm, Drainage=%.2f mm, New balance=%.2f mm",
+                    zone_config.name,
+                    et_actual,
+                    drainage_rate,
+                    zone_state.soil_moisture_balance,
+                )
 
-            # Update number entity
-            update_zone_number(
-                hass, entry_id, zone_id, zone_state.soil_moisture_balance
-            )
+            updates.append((zone_id, zone_state.soil_moisture_balance))
+
+        # Update all number entities in one pass
+        update_zone_numbers(hass, entry_id, updates)
 
-    except Exception as e:
-        _LOGGER.exception("Error calculating ET: %s", e)
+    except Exception:
+        _LOGGER.exception("Error calculating ET")
 
 
+@callback
 def update_et0_sensor(hass: HomeAssistant, entry_id: str, et0_value: float) -> None:
     """Update the reference ET sensor."""
-    if DOMAIN not in hass.data or entry_id not in hass.data[DOMAIN]:
+    if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
         return
 
-    entities = hass.data[DOMAIN][entry_id].get("entities", {})
-    et0_sensor_key = "et0_sensor"
-
-    if et0_sensor_key in entities:
-        et0_sensor = entities[et0_sensor_key]
-        et0_sensor.update_et0(et0_value)
+    state = entry_data.get("state")
+    if state is not None and state.et0_sensor is not None:
+        state.et0_sensor.update_et0(et0_value)
 
 
+@callback
 def update_zone_number(
     hass: HomeAssistant, entry_id: str, zone_id: str, balance: float
 ) -> None:
     """Update the soil moisture balance number for a zone with clipping to min/max limits."""
-    if DOMAIN not in hass.data or entry_id not in hass.data[DOMAIN]:
+    update_zone_numbers(hass, entry_id, [(zone_id, balance)])
+
+
+@callback
+def update_zone_numbers(
+    hass: HomeAssistant, entry_id: str, updates: list[tuple[str, float]]
+) -> None:
+    """Update soil moisture balance numbers for several zones in one pass.
+
+    Balances are clipped to each zone's min/max limits before being stored
+    in state and pushed to the number entities. The updated zones are then
+    recalculated together, reading the forecast entity once.
+    """
+    # Timers and delayed callbacks can still fire after the entry unloads
+    if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
         return
 
-    entry_data = hass.data[DOMAIN][entry_id]
-    entities = entry_data.get("entities", {})
     config = entry_data.get("config")
     state = entry_data.get("state")
-    
-    if not config or not state or zone_id not in config.zones:
+
+    if not config or not state:
         return
-    
-    zone_config = config.zones[zone_id]
-    
-    # Clip balance to configured limits
-    original_balance = balance
-    if balance > zone_config.max_balance:
-        balance = zone_config.max_balance
-        _LOGGER.info(
-            "Zone %s: Balance clipped from %.2f to max %.2f mm",
-            zone_config.name,
-            original_balance,
-            balance,
-        )
-    elif balance < zone_config.min_balance:
-        balance = zone_config.min_balance
-        _LOGGER.info(
-            "Zone %s: Balance clipped from %.2f to min %.2f mm",
-            zone_config.name,
-            original_balance,
-            balance,
-        )
-    
-    # Update the state with clipped value
-    state.zones[zone_id].soil_moisture_balance = balance
-    
-    # Update the number entity
-    number_key = f"soil_moisture_balance_{zone_id}"
-    if number_key in entities:
-        number = entities[number_key]
-        number.update_value(balance)
-
-
-def update_runtime_sensors(hass: HomeAssistant, entry_id: str, zone_id: str) -> None:
-    """Recalculate zone values and notify entities to refresh from state."""
-    if DOMAIN not in hass.data or entry_id not in hass.data[DOMAIN]:
+
+    updated_zones = []
+    for zone_id, balance in updates:
+        if zone_id not in config.zones:
+            continue
+
+        zone_config = config.zones[zone_id]
+
+        # Clip balance to configured limits
+        original_balance = balance
+        if balance > zone_config.max_balance:
+            balance = zone_config.max_balance
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "Zone %s: Balance clipped from %.2f to max %.2f mm",
+                    zone_config.name,
+                    original_balance,
+                    balance,
+                )
+        elif balance < zone_config.min_balance:
+            balance = zone_config.min_balance
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "Zone %s: Balance clipped from %.2f to min %.2f mm",
+                    zone_config.name,
+                    original_balance,
+                    balance,
+                )
+
+        # Update the state with clipped value
+        zone_state = state.zones[zone_id]
+        zone_state.soil_moisture_balance = balance
+
+        # Update the number entity
+        if zone_state.number_entity is not None:
+            zone_state.number_entity.update_value(balance)
+        updated_zones.append(zone_id)
+
+    if not updated_zones:
         return
-    
-    entry_data = hass.data[DOMAIN][entry_id]
-    entities = entry_data.get("entities", {})
+
+    forecast_rain = get_forecast_rain(hass, config)
+    for zone_id in updated_zones:
+        update_runtime_sensors(hass, entry_id, zone_id, forecast_rain)
+
+
+@callback
+def update_runtime_sensors(
+    hass: HomeAssistant,
+    entry_id: str,
+    zone_id: str,
+    forecast_rain: float | None = None,
+) -> None:
+    """Recalculate zone values and notify entities to refresh from state.
+
+    Pass forecast_rain when updating several zones at once so the forecast
+    entity is only read and parsed once.
+    """
+    # Timers and delayed callbacks can still fire after the entry unloads
+    if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+        return
+
     config = entry_data.get("config")
     state = entry_data.get("state")
-    
+
     if not config or not state or zone_id not in state.zones:
         return
-    
+
     zone_config = config.zones.get(zone_id)
     zone_state = state.zones[zone_id]
-    
+
     if not zone_config:
         return
-    
+
     # Perform calculation ONCE and store in state
-    update_zone_calculations(hass, config, zone_config, zone_state)
-    
+    update_zone_calculations(hass, config, zone_config, zone_state, forecast_rain)
+
     # Notify entities to refresh their values from state
-    runtime_key = f"runtime_{zone_id}"
-    if runtime_key in entities:
-        entities[runtime_key].refresh_from_state()
-    
-    can_run_key = f"can_run_{zone_id}"
-    if can_run_key in entities:
-        entities[can_run_key].refresh_from_state()
-    
-    next_runtime_key = f"next_runtime_{zone_id}"
-    if next_runtime_key in entities:
-        entities[next_runtime_key].refresh_from_state()
-
-
-
-def update_next_runtime_sensor(
-    hass: HomeAssistant, entry_id: str, zone_id: str
-) -> None:
-    """Update the next runtime sensor for a zone."""
-    if DOMAIN not in hass.data or entry_id not in hass.data[DOMAIN]:
-        return
+    if zone_state.runtime_sensor is not None:
+        zone_state.runtime_sensor.refresh_from_state()
+
+    if zone_state.can_run_sensor is not None:
+        zone_state.can_run_sensor.refresh_from_state()
 
-    entities = hass.data[DOMAIN][entry_id].get("entities", {})
-    next_runtime_key = f"next_runtime_{zone_id}"
+    if zone_state.next_runtime_sensor is not None:
+        zone_state.next_runtime_sensor.refresh_from_state()
 
-    if next_runtime_key in entities:
-        next_runtime_sensor = entities[next_runtime_key]
-        next_runtime_sensor.update_next_runtime()
@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
 import logging
+import sys
+from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
 
 from .const import DOMAIN, get_device_info
 
+if TYPE_CHECKING:
+    from .state import ZoneState
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -26,25 +29,23 @@ async def async_setup_entry(
 
     device_info = get_device_info(entry)
     
-    # Get zones from config
-    config_data = {**entry.data, **entry.options}
-    zones = config_data.get("zones", [])
+    # Get zones from config (options override the original data)
+    if "zones" in entry.options:
+        zones = entry.options["zones"]
+    else:
+        zones = entry.data.get("zones", [])
     
+    state = hass.data[DOMAIN][entry.entry_id]["state"]
     binary_sensors = []
     
-    # Create can run binary sensor for each zone
+    # Create can run binary sensor for each zone, wiring a direct reference
+    # on the zone state so updates call it without a lookup
     for idx, zone in enumerate(zones):
-        zone_id = f"zone_{idx}"
+        zone_id = sys.intern(f"zone_{idx}")
         binary_sensor = ZoneCanRunBinarySensor(entry, device_info, zone_id, zone.get("name", f"Zone {idx + 1}"))
         binary_sensors.append(binary_sensor)
-    
-    # Store entity references in the entry-specific data
-    if "entities" not in hass.data[DOMAIN][entry.entry_id]:
-        hass.data[DOMAIN][entry.entry_id]["entities"] = {}
-    
-    for binary_sensor in binary_sensors:
-        zone_id = binary_sensor._zone_id
-        hass.data[DOMAIN][entry.entry_id]["entities"][f"can_run_{zone_id}"] = binary_sensor
+        if (zone_state := state.zones.get(zone_id)) is not None:
+            zone_state.can_run_sensor = binary_sensor
     
     async_add_entities(binary_sensors)
 
@@ -68,53 +69,31 @@ class ZoneCanRunBinarySensor(BinarySensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_{zone_id}_can_run"
         self._attr_is_on = False
         self._attr_device_info = device_info
+        self._zone_state: ZoneState | None = None  # Resolved when added to hass
     
     async def async_added_to_hass(self) -> None:
-        """Run when entity is added to hass - set up periodic updates."""
+        """Run when entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Periodic refresh to re-check minimum interval condition
-        # (coordinator recalculates, then we refresh from state)
-        self.async_on_remove(
-            async_track_time_interval(
-                self.hass,
-                self._periodic_refresh,
-                timedelta(minutes=1)
-            )
-        )
+        # The zone state outlives this entity, so resolve it once
+        state = self.hass.data[DOMAIN][self._entry_id]["state"]
+        self._zone_state = state.zones.get(self._zone_id)
     
-    @callback
-    def _periodic_refresh(self, now: datetime) -> None:
-        """Periodic refresh - trigger recalculation via coordinator."""
-        # Import here to avoid circular imports
-        from . import update_runtime_sensors
-        update_runtime_sensors(self.hass, self._entry_id, self._zone_id)
-
     @callback
     def refresh_from_state(self) -> None:
         """Refresh entity value from pre-calculated state."""
-        if DOMAIN not in self.hass.data or self._entry_id not in self.hass.data[DOMAIN]:
-            self._attr_is_on = False
-            self.async_write_ha_state()
-            return
-        
-        entry_data = self.hass.data[DOMAIN][self._entry_id]
-        state = entry_data.get("state")
-        config = entry_data.get("config")
-        
-        if not state or self._zone_id not in state.zones:
-            self._attr_is_on = False
-            self.async_write_ha_state()
-            return
-        
-        zone_state = state.zones[self._zone_id]
-        zone_config = config.zones.get(self._zone_id) if config else None
+        if self._zone_state is None:
+            return  # Not added yet, refreshed again once it is
         
         # Read pre-calculated value from state
-        self._attr_is_on = zone_state.calculated.can_run
+        calculated = self._zone_state.calculated
+        can_run = calculated.can_run
+        if not can_run and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Zone %s cannot run: %s", self._zone_name, calculated.reason)
         
-        if not zone_state.calculated.can_run and zone_config:
-            _LOGGER.debug("Zone %s cannot run: %s", zone_config.name, zone_state.calculated.reason)
+        # Most refreshes leave the value unchanged; only write real changes
+        if can_run == self._attr_is_on:
+            return
         
+        self._attr_is_on = can_run
         self.async_write_ha_state()
-
@@ -7,8 +7,10 @@ simply read from state for display.
 
 from __future__ import annotations
 
-from datetime import datetime
+from functools import lru_cache
 import logging
+import math
+import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,6 +20,18 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity states that carry no usable value. Stringified None and empty
+# states are included so they are rejected without a float() exception
+_INVALID_STATES = frozenset(("unknown", "unavailable", "None", "none", ""))
+
+# Reasons for the can_run status, as %-style templates. Arguments are stored
+# alongside and only formatted when the reason is actually read
+REASON_INTERVAL_NOT_MET = "Minimum interval not met (%.0fs < %ss)"
+REASON_NO_DEFICIT = "No moisture deficit"
+REASON_FORECAST_COVERS = "Forecasted rain (%.1fmm) covers deficit"
+REASON_RUNTIME_TOO_SHORT = "Runtime too short (%.0fs < %ss minimum)"
+REASON_READY = "Ready to run"
+
 
 def get_forecast_rain(hass: HomeAssistant, config: Config) -> float:
     """Get forecasted rain amount from configured entity.
@@ -33,53 +47,99 @@ def get_forecast_rain(hass: HomeAssistant, config: Config) -> float:
         return 0.0
     
     forecast_state = hass.states.get(config.weather_sensors.forecast_rain_entity)
-    if forecast_state and forecast_state.state not in ("unknown", "unavailable"):
-        try:
-            return max(0.0, float(forecast_state.state))
-        except (ValueError, TypeError):
-            _LOGGER.warning("Invalid forecast rain value: %s", forecast_state.state)
+    if forecast_state is None:
+        return 0.0
+    
+    raw = forecast_state.state
+    if raw in _INVALID_STATES:
+        return 0.0
+    
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        _LOGGER.warning("Invalid forecast rain value: %s", raw)
     
     return 0.0
 
 
-def calculate_effective_deficit(
-    balance: float,
-    forecast_rain: float
+def calculate_runtime_seconds(
+    deficit_mm: float,
+    seconds_per_mm: float
 ) -> float:
-    """Calculate effective moisture deficit accounting for forecasted rain.
+    """Calculate runtime needed to cover a deficit.
     
     Args:
-        balance: Current soil moisture balance (negative = deficit)
-        forecast_rain: Forecasted rain in mm
+        deficit_mm: Moisture deficit in mm
+        seconds_per_mm: Sprinkler runtime per mm applied (see ZoneConfig)
         
     Returns:
-        Effective deficit in mm (always >= 0), or 0 if no deficit
+        Runtime in seconds
     """
-    if balance >= 0:
+    if deficit_mm <= 0:
         return 0.0
     
-    deficit_mm = abs(balance)
-    return max(0.0, deficit_mm - forecast_rain)
+    return deficit_mm * seconds_per_mm
 
 
-def calculate_runtime_seconds(
-    deficit_mm: float,
-    precipitation_rate: float
+@lru_cache(maxsize=32)
+def calculate_extraterrestrial_radiation(lat: float, day_of_year: int) -> float:
+    """Calculate daily extraterrestrial radiation (FAO-56 equation 21).
+    
+    Only depends on the site and the date, so results are cached.
+    
+    Args:
+        lat: Site latitude in radians (as expected by pyet)
+        day_of_year: Day of the year (1-366)
+        
+    Returns:
+        Extraterrestrial radiation in MJ/m²/day
+    """
+    inverse_distance = 1 + 0.033 * math.cos(2 * math.pi * day_of_year / 365)
+    declination = 0.409 * math.sin(2 * math.pi * day_of_year / 365 - 1.39)
+    
+    # Clamp for polar day/night where the sunset hour angle is undefined
+    cos_sunset = max(-1.0, min(1.0, -math.tan(lat) * math.tan(declination)))
+    sunset_angle = math.acos(cos_sunset)
+    
+    return (
+        24 * 60 / math.pi
+        * 0.0820
+        * inverse_distance
+        * (
+            sunset_angle * math.sin(lat) * math.sin(declination)
+            + math.cos(lat) * math.cos(declination) * math.sin(sunset_angle)
+        )
+    )
+
+
+def calculate_hargreaves_et0(
+    tmean: float,
+    tmax: float,
+    tmin: float,
+    lat: float,
+    day_of_year: int,
 ) -> float:
-    """Calculate runtime needed to cover a deficit.
+    """Calculate reference ET using the Hargreaves equation.
+    
+    Mirrors pyet.hargreaves (method 0) for a single day so the fallback
+    path does not need pandas.
     
     Args:
-        deficit_mm: Moisture deficit in mm
-        precipitation_rate: Sprinkler precipitation rate in mm/hour
+        tmean: Mean daily temperature in °C
+        tmax: Maximum daily temperature in °C
+        tmin: Minimum daily temperature in °C
+        lat: Site latitude in radians (as expected by pyet)
+        day_of_year: Day of the year (1-366)
         
     Returns:
-        Runtime in seconds
+        Reference ET in mm/day (always >= 0)
     """
-    if deficit_mm <= 0 or precipitation_rate <= 0:
-        return 0.0
+    ra = calculate_extraterrestrial_radiation(lat, day_of_year)
     
-    runtime_hours = deficit_mm / precipitation_rate
-    return runtime_hours * 3600
+    # Latent heat of vaporization (MJ/kg) converts radiation to mm of water
+    lambd = 2.501 - 0.002361 * tmean
+    et0 = 0.0023 * (tmean + 17.8) * math.sqrt(max(0.0, tmax - tmin)) * ra / lambd
+    return max(0.0, et0)
 
 
 def update_zone_calculations(
@@ -87,6 +147,7 @@ def update_zone_calculations(
     config: Config,
     zone_config: ZoneConfig,
     zone_state: ZoneState,
+    forecast_rain: float | None = None,
 ) -> None:
     """Calculate and store runtime information for a zone.
     
@@ -98,33 +159,63 @@ def update_zone_calculations(
         config: Integration configuration
         zone_config: Zone-specific configuration
         zone_state: Zone-specific state (will be mutated)
+        forecast_rain: Forecasted rain in mm if already known, so callers
+            updating several zones only read the forecast entity once
     """
     balance = zone_state.soil_moisture_balance
-    forecast_rain = get_forecast_rain(hass, config)
+    calc = zone_state.calculated
+    
+    # No deficit: nothing to run, so skip reading the forecast entirely
+    if balance >= 0:
+        calc.effective_deficit_mm = 0.0
+        calc.required_runtime_seconds = 0.0
+        calc.clamped_runtime_seconds = 0.0
+        calc.forecast_rain_mm = 0.0
+        calc.can_run = False
+        calc.reason_template = REASON_NO_DEFICIT
+        calc.reason_args = ()
+        calc.last_inputs = None
+        return
+    
+    if forecast_rain is None:
+        forecast_rain = get_forecast_rain(hass, config)
     
-    # Calculate effective deficit
-    effective_deficit = calculate_effective_deficit(balance, forecast_rain)
+    # Zone config is fixed for the life of the entry, so the results only
+    # depend on the balance, the forecast and whether the interval is pending.
+    # A pending interval is never cached as it changes with time alone
+    off_time = zone_state.sprinkler_off_time
+    interval_pending = (
+        off_time is not None
+        and time.monotonic() - off_time < zone_config.minimum_interval
+    )
+    inputs = None if interval_pending else (balance, forecast_rain)
+    if inputs is not None and inputs == calc.last_inputs:
+        return
+    
+    # Effective deficit after forecast rain (balance is negative here)
+    deficit = -balance
+    effective_deficit = deficit - forecast_rain if deficit > forecast_rain else 0.0
     
     # Calculate required runtime
     required_runtime = calculate_runtime_seconds(
         effective_deficit, 
-        zone_config.precipitation_rate
+        zone_config.seconds_per_mm
     )
     
     # Clamp to min/max limits for actual runtime
     if required_runtime > 0:
-        clamped_runtime = max(
-            zone_config.min_runtime, 
-            min(required_runtime, zone_config.max_runtime)
-        )
+        low, high = zone_config.runtime_bounds
+        if required_runtime < low:
+            clamped_runtime = low
+        elif required_runtime > high:
+            clamped_runtime = high
+        else:
+            clamped_runtime = required_runtime
     else:
         clamped_runtime = 0.0
     
-    # Ensure clamped runtime is never negative
-    clamped_runtime = max(0.0, clamped_runtime)
-    
     # Determine if zone can run and why
-    can_run, reason = _evaluate_can_run(
+    can_run, reason_template, reason_args = _evaluate_can_run(
         balance=balance,
         effective_deficit=effective_deficit,
         required_runtime=required_runtime,
@@ -134,13 +225,14 @@ def update_zone_calculations(
     )
     
     # Store all calculated values in state
-    calc = zone_state.calculated
     calc.effective_deficit_mm = effective_deficit
     calc.required_runtime_seconds = required_runtime
     calc.clamped_runtime_seconds = clamped_runtime
     calc.forecast_rain_mm = forecast_rain
     calc.can_run = can_run
-    calc.reason = reason
+    calc.reason_template = reason_template
+    calc.reason_args = reason_args
+    calc.last_inputs = inputs
 
 
 def _evaluate_can_run(
@@ -150,7 +242,7 @@ def _evaluate_can_run(
     forecast_rain: float,
     zone_config: ZoneConfig,
     zone_state: ZoneState,
-) -> tuple[bool, str]:
+) -> tuple[bool, str, tuple]:
     """Evaluate whether a zone can run based on all constraints.
     
     Args:
@@ -162,24 +254,24 @@ def _evaluate_can_run(
         zone_state: Zone state
         
     Returns:
-        Tuple of (can_run, reason)
+        Tuple of (can_run, reason template, reason arguments)
     """
     # Check minimum interval has passed
     if zone_state.sprinkler_off_time is not None:
-        time_since_off = (datetime.now() - zone_state.sprinkler_off_time).total_seconds()
+        time_since_off = time.monotonic() - zone_state.sprinkler_off_time
         if time_since_off < zone_config.minimum_interval:
-            return False, f"Minimum interval not met ({time_since_off:.0f}s < {zone_config.minimum_interval}s)"
+            return False, REASON_INTERVAL_NOT_MET, (time_since_off, zone_config.minimum_interval)
     
     # No deficit at all
     if balance >= 0:
-        return False, "No moisture deficit"
+        return False, REASON_NO_DEFICIT, ()
     
     # Forecast rain covers the deficit
     if effective_deficit <= 0:
-        return False, f"Forecasted rain ({forecast_rain:.1f}mm) covers deficit"
+        return False, REASON_FORECAST_COVERS, (forecast_rain,)
     
     # Runtime too short
     if required_runtime < zone_config.min_runtime:
-        return False, f"Runtime too short ({required_runtime:.0f}s < {zone_config.min_runtime}s minimum)"
+        return False, REASON_RUNTIME_TOO_SHORT, (required_runtime, zone_config.min_runtime)
     
-    return True, "Ready to run"
+    return True, REASON_READY, ()
@@ -1,28 +1,36 @@
-"""Configuration classes for Adaptive Irrigation integration."""
+"""Configuration classes for Adaptive Irrigation integration.
 
+Configuration is parsed once per config entry and never changed afterwards;
+options changes reload the entry and build a new one.
+"""
 
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True, frozen=True)
 class WeatherSensorConfig:
     """Configuration for weather sensors."""
 
     temperature_entity: str
     humidity_entity: str
+    precipitation_entity: str
     wind_speed_entity: str | None = None
     solar_radiation_entity: str | None = None
     pressure_entity: str | None = None
-    precipitation_entity: str
     forecast_rain_entity: str | None = None
-    latitude: float
-    longitude: float
-    elevation: float
+    latitude: float = 0.0
+    longitude: float = 0.0
+    elevation: float = 0.0
 
 
+@dataclass(slots=True, frozen=True)
 class ZoneConfig:
     """Configuration for an irrigation zone."""
 
     name: str
     zone_id: str
     sprinkler_entity: str
-    precipitation_rate: float  # mm/hour
+    precipitation_rate: float = 10.0  # mm/hour
     crop_coefficient: float = 1.0  # Kc for ET adjustment
     max_runtime: int = 3600  # seconds
     min_runtime: int = 60  # seconds
@@ -30,11 +38,27 @@ class ZoneConfig:
     max_balance: float = 5.0  # mm - don't run if balance is above this
     min_balance: float = -20.0  # mm - don't run if balance is below this (too dry for effective irrigation)
     drainage_rate: float = 1.0  # mm/day - water loss through drainage
+    seconds_per_mm: float = field(init=False)  # runtime per mm applied, 0 if no rate
+    runtime_bounds: tuple[float, float] = field(init=False)  # (low, high) clamp in seconds
+
+    def __post_init__(self) -> None:
+        """Derive per-zone constants used by the runtime calculation."""
+        # A zero rate (allowed by the config flow) can never cover a deficit
+        seconds_per_mm = (
+            3600.0 / self.precipitation_rate if self.precipitation_rate > 0 else 0.0
+        )
+        object.__setattr__(self, "seconds_per_mm", seconds_per_mm)
+
+        # Runtimes are never negative, and the minimum wins if the limits cross
+        low = max(0.0, float(self.min_runtime))
+        high = max(low, float(self.max_runtime))
+        object.__setattr__(self, "runtime_bounds", (low, high))
 
 
+@dataclass(slots=True, frozen=True)
 class Config:
     """Configuration for Adaptive Irrigation integration."""
 
     weather_sensors: WeatherSensorConfig
-    zones: dict[str, ZoneConfig] = {}
+    zones: dict[str, ZoneConfig] = field(default_factory=dict)
     et_method: str = "penman_monteith"
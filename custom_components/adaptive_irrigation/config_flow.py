@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import ChainMap
+from functools import cache
 import logging
 from typing import Any
 
@@ -24,10 +26,209 @@ DEFAULT_CROP_COEFFICIENT = 1.0
 
 
 def _filter_none_values(data: dict[str, Any]) -> dict[str, Any]:
-    """Remove None values from dictionary to prevent entity validation errors."""
+    """Remove None values from dictionary to prevent entity validation errors.
+
+    The input is returned as-is when it has no None values, which is the
+    usual case for a submitted form.
+    """
+    if None not in data.values():
+        return data
     return {k: v for k, v in data.items() if v is not None}
 
 
+# Lowercases ASCII and replaces spaces in one pass for the unique ID slug
+_SLUG_TABLE = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ ", "abcdefghijklmnopqrstuvwxyz_"
+)
+
+
+def _slugify_name(name: str) -> str:
+    """Return the unique ID slug for an entry name."""
+    if name.isascii():
+        return name.translate(_SLUG_TABLE)
+    # str.lower() also folds non-ASCII letters, keep existing IDs unchanged
+    return name.lower().replace(" ", "_")
+
+
+_WEATHER_REQUIRED = ("temperature_entity", "humidity_entity", "precipitation_entity")
+# Optional weather sensor keys and the name of their selector
+_WEATHER_OPTIONAL = (
+    ("wind_speed_entity", "sensor_num"),
+    ("solar_radiation_entity", "sensor_num"),
+    ("pressure_entity", "sensor_num"),
+    ("forecast_rain_entity", "sensor_num_forecast"),
+)
+
+# Zone form fields as (key, required, selector name, add form default)
+_ZONE_FORM_FIELDS = (
+    ("name", True, "text", None),
+    ("sprinkler_entity", True, "sprinkler", None),
+    ("precipitation_rate", True, "mm_hour", 10.0),
+    ("drainage_rate", False, "mm_day", 1.0),
+    ("crop_coefficient", False, "coeff", DEFAULT_CROP_COEFFICIENT),
+    ("max_runtime", False, "seconds", 3600),
+    ("min_runtime", False, "seconds", 60),
+    ("minimum_interval", False, "seconds", 3600),
+    ("max_balance", False, "mm_bal", 5.0),
+    ("min_balance", False, "mm_bal", -20.0),
+)
+# Suggested when editing a zone saved without some of the fields
+_ZONE_FORM_DEFAULTS = {
+    key: default
+    for key, _required, _sel_name, default in _ZONE_FORM_FIELDS
+    if default is not None
+}
+
+# Schemas are only needed once a flow is opened, so they (and the selectors
+# they use) are built on first use and cached. Per-entry values (location,
+# current settings) are applied as suggested values when the form is shown
+
+
+@cache
+def _selectors() -> dict[str, selector.Selector]:
+    """Return the selectors shared by every schema, keyed by name.
+
+    Selectors are immutable, so one instance of each is enough.
+    """
+    box = selector.NumberSelectorMode.BOX
+    return {
+        "text": selector.TextSelector(),
+        "bool": selector.BooleanSelector(),
+        "sensor_num": selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain=["sensor", "input_number"], multiple=False
+            )
+        ),
+        "sensor_num_forecast": selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain=["sensor", "input_number", "number"], multiple=False
+            )
+        ),
+        "sprinkler": selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain=["switch", "input_boolean", "valve", "binary_sensor"]
+            )
+        ),
+        "lat": selector.NumberSelector(
+            selector.NumberSelectorConfig(min=-90, max=90, mode=box)
+        ),
+        "lon": selector.NumberSelector(
+            selector.NumberSelectorConfig(min=-180, max=180, mode=box)
+        ),
+        "elev": selector.NumberSelector(selector.NumberSelectorConfig(min=0, mode=box)),
+        "num_zones": selector.NumberSelector(
+            selector.NumberSelectorConfig(min=0, max=20, mode=box)
+        ),
+        "mm_hour": selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, mode=box, unit_of_measurement="mm/hour"
+            )
+        ),
+        "mm_day": selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, max=50, mode=box, unit_of_measurement="mm/day"
+            )
+        ),
+        "coeff": selector.NumberSelector(
+            selector.NumberSelectorConfig(min=0, max=2, mode=box)
+        ),
+        "seconds": selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, mode=box, unit_of_measurement="seconds"
+            )
+        ),
+        "mm_bal": selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=-200, max=200, mode=box, unit_of_measurement="mm"
+            )
+        ),
+    }
+
+
+@cache
+def _user_schema() -> vol.Schema:
+    """Return the schema for the initial name and weather sensors step."""
+    sel = _selectors()
+    return vol.Schema(
+        {
+            vol.Required("name", default="Adaptive Irrigation"): sel["text"],
+            vol.Required("temperature_entity"): sel["sensor_num"],
+            vol.Required("humidity_entity"): sel["sensor_num"],
+            vol.Required("precipitation_entity"): sel["sensor_num"],
+            vol.Optional("wind_speed_entity"): sel["sensor_num"],
+            vol.Optional("solar_radiation_entity"): sel["sensor_num"],
+            vol.Optional("pressure_entity"): sel["sensor_num"],
+            vol.Optional("forecast_rain_entity"): sel["sensor_num_forecast"],
+        }
+    )
+
+
+@cache
+def _weather_schema() -> vol.Schema:
+    """Return the weather sensors options schema without defaults."""
+    sel = _selectors()
+    schema_fields = {
+        vol.Required(key): sel["sensor_num"] for key in _WEATHER_REQUIRED
+    }
+    for key, sel_name in _WEATHER_OPTIONAL:
+        schema_fields[vol.Optional(key)] = sel[sel_name]
+    return vol.Schema(schema_fields)
+
+
+@cache
+def _location_schema() -> vol.Schema:
+    """Return the location schema; defaults are applied as suggested values."""
+    sel = _selectors()
+    return vol.Schema(
+        {
+            vol.Required("latitude"): sel["lat"],
+            vol.Required("longitude"): sel["lon"],
+            vol.Required("elevation"): sel["elev"],
+        }
+    )
+
+
+@cache
+def _zones_schema() -> vol.Schema:
+    """Return the schema asking how many zones to configure."""
+    return vol.Schema(
+        {
+            vol.Required("num_zones", default=1): _selectors()["num_zones"],
+        }
+    )
+
+
+def _zone_fields(with_defaults: bool) -> dict[vol.Marker, selector.Selector]:
+    """Return the zone form fields, with or without the add form defaults."""
+    sel = _selectors()
+    schema_fields: dict[vol.Marker, selector.Selector] = {}
+    for key, required, sel_name, default in _ZONE_FORM_FIELDS:
+        marker = vol.Required if required else vol.Optional
+        if with_defaults and default is not None:
+            schema_fields[marker(key, default=default)] = sel[sel_name]
+        else:
+            schema_fields[marker(key)] = sel[sel_name]
+    return schema_fields
+
+
+@cache
+def _zone_schema_base() -> vol.Schema:
+    """Return the schema for adding a zone."""
+    return vol.Schema(_zone_fields(with_defaults=True))
+
+
+@cache
+def _edit_zone_schema() -> vol.Schema:
+    """Return the zone schema with the delete toggle, for editing.
+
+    Current zone values are applied with add_suggested_values_to_schema, so
+    the fields carry no defaults that would replace a cleared saved value.
+    """
+    return vol.Schema(_zone_fields(with_defaults=False)).extend(
+        {vol.Required("delete_zone", default=False): _selectors()["bool"]}
+    )
+
+
 class AdaptiveIrrigationConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Adaptive Irrigation."""
 
@@ -61,7 +262,7 @@ class AdaptiveIrrigationConfigFlow(ConfigFlow, domain=DOMAIN):
                 # Store name and create unique ID
                 self._name = user_input["name"]
 
-                await self.async_set_unique_id(self._name.lower().replace(" ", "_"))
+                await self.async_set_unique_id(_slugify_name(self._name))
                 self._abort_if_unique_id_configured()
 
                 # Store the weather sensor configuration
@@ -71,49 +272,9 @@ class AdaptiveIrrigationConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
                 _LOGGER.exception("Error in user step: %s", e)
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    "name", default="Adaptive Irrigation"
-                ): selector.TextSelector(),
-                vol.Required("temperature_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor", "input_number"], multiple=False
-                    )
-                ),
-                vol.Required("humidity_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor", "input_number"], multiple=False
-                    )
-                ),
-                vol.Required("precipitation_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor", "input_number"], multiple=False
-                    )
-                ),
-                vol.Optional("wind_speed_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor", "input_number"], multiple=False
-                    )
-                ),
-                vol.Optional("solar_radiation_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor", "input_number"], multiple=False
-                    )
-                ),
-                vol.Optional("pressure_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor", "input_number"], multiple=False
-                    )
-                ),
-                vol.Optional("forecast_rain_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor", "input_number", "number"], multiple=False
-                    )
-                ),
-            }
+        return self.async_show_form(
+            step_id="user", data_schema=_user_schema(), errors=errors
         )
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
 
     async def async_step_location(
         self, user_input: dict[str, Any] | None = None
@@ -123,31 +284,17 @@ class AdaptiveIrrigationConfigFlow(ConfigFlow, domain=DOMAIN):
             self._basic_config.update(_filter_none_values(user_input))
             return await self.async_step_zones()
 
-        # Get default location from Home Assistant config
-        latitude = self.hass.config.latitude
-        longitude = self.hass.config.longitude
-        elevation = self.hass.config.elevation
-
-        schema = vol.Schema(
-            {
-                vol.Required("latitude", default=latitude): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-90, max=90, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Required("longitude", default=longitude): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-180, max=180, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Required("elevation", default=elevation): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-            }
+        # Prefill location from Home Assistant config
+        hass_config = self.hass.config
+        defaults = {
+            "latitude": hass_config.latitude,
+            "longitude": hass_config.longitude,
+            "elevation": hass_config.elevation,
+        }
+        return self.async_show_form(
+            step_id="location",
+            data_schema=self.add_suggested_values_to_schema(_location_schema(), defaults),
         )
-        return self.async_show_form(step_id="location", data_schema=schema)
 
     async def async_step_zones(
         self, user_input: dict[str, Any] | None = None
@@ -160,21 +307,12 @@ class AdaptiveIrrigationConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._num_zones = num_zones
                 self._zones = []
                 self._current_zone_index = 0
-                return await self.async_step_zone_config()
+                return self._show_zone_form()
             # No zones configured, finish setup
             self._basic_config["zones"] = []
             return self.async_create_entry(title=self._name, data=self._basic_config)
 
-        schema = vol.Schema(
-            {
-                vol.Required("num_zones", default=1): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0, max=20, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-            }
-        )
-        return self.async_show_form(step_id="zones", data_schema=schema)
+        return self.async_show_form(step_id="zones", data_schema=_zones_schema())
 
     async def async_step_zone_config(
         self, user_input: dict[str, Any] | None = None
@@ -185,88 +323,21 @@ class AdaptiveIrrigationConfigFlow(ConfigFlow, domain=DOMAIN):
             self._zones.append(_filter_none_values(user_input))
             self._current_zone_index += 1
 
-            # Check if we need to configure more zones
-            if self._current_zone_index < self._num_zones:
-                return await self.async_step_zone_config()
-
             # All zones configured, finish setup
-            self._basic_config["zones"] = self._zones
-            return self.async_create_entry(title=self._name, data=self._basic_config)
+            if self._current_zone_index >= self._num_zones:
+                self._basic_config["zones"] = self._zones
+                return self.async_create_entry(
+                    title=self._name, data=self._basic_config
+                )
 
-        schema = vol.Schema(
-            {
-                vol.Required("name"): selector.TextSelector(),
-                vol.Required("sprinkler_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "input_boolean", "valve", "binary_sensor"]
-                    )
-                ),
-                vol.Required(
-                    "precipitation_rate", default=10.0
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm/hour",
-                    )
-                ),
-                vol.Optional("drainage_rate", default=1.0): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        max=50,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm/day",
-                    )
-                ),
-                vol.Optional(
-                    "crop_coefficient", default=DEFAULT_CROP_COEFFICIENT
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0, max=2, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Optional("max_runtime", default=3600): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional("min_runtime", default=60): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional("minimum_interval", default=3600): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional("max_balance", default=5.0): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-200,
-                        max=200,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm",
-                    )
-                ),
-                vol.Optional("min_balance", default=-20.0): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-200,
-                        max=200,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm",
-                    )
-                ),
-            }
-        )
+        return self._show_zone_form()
+
+    @callback
+    def _show_zone_form(self) -> ConfigFlowResult:
+        """Show the form for the zone at the current index."""
         return self.async_show_form(
             step_id="zone_config",
-            data_schema=schema,
+            data_schema=_zone_schema_base(),
             description_placeholders={
                 "zone_number": str(self._current_zone_index + 1),
                 "total_zones": str(self._num_zones),
@@ -301,134 +372,43 @@ class AdaptiveIrrigationOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Configure weather sensors."""
+        current_config = ChainMap(self.config_entry.options, self.config_entry.data)
         if user_input is not None:
-            current_options = {**self.config_entry.data, **self.config_entry.options}
-            updated_options = {**current_options, **_filter_none_values(user_input)}
+            updated_options = {**current_config, **_filter_none_values(user_input)}
             return self.async_create_entry(title="", data=updated_options)
 
-        current_config = {**self.config_entry.data, **self.config_entry.options}
-
-        schema_fields = {
-            vol.Required(
-                "temperature_entity",
-                default=current_config.get("temperature_entity"),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor", "input_number"])
-            ),
-            vol.Required(
-                "humidity_entity",
-                default=current_config.get("humidity_entity"),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor", "input_number"])
-            ),
-            vol.Required(
-                "precipitation_entity",
-                default=current_config.get("precipitation_entity"),
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor", "input_number"])
+        return self.async_show_form(
+            step_id="weather_sensors",
+            data_schema=self.add_suggested_values_to_schema(
+                _weather_schema(), current_config
             ),
-        }
-
-        # Add optional entities with defaults if they exist
-        wind_entity = current_config.get("wind_speed_entity")
-        if wind_entity:
-            schema_fields[vol.Optional("wind_speed_entity", default=wind_entity)] = (
-                selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["sensor", "input_number"])
-                )
-            )
-        else:
-            schema_fields[vol.Optional("wind_speed_entity")] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor", "input_number"])
-            )
-
-        solar_entity = current_config.get("solar_radiation_entity")
-        if solar_entity:
-            schema_fields[
-                vol.Optional("solar_radiation_entity", default=solar_entity)
-            ] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor", "input_number"])
-            )
-        else:
-            schema_fields[vol.Optional("solar_radiation_entity")] = (
-                selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["sensor", "input_number"])
-                )
-            )
-
-        pressure_entity = current_config.get("pressure_entity")
-        if pressure_entity:
-            schema_fields[vol.Optional("pressure_entity", default=pressure_entity)] = (
-                selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["sensor", "input_number"])
-                )
-            )
-        else:
-            schema_fields[vol.Optional("pressure_entity")] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor", "input_number"])
-            )
-
-        forecast_rain_entity = current_config.get("forecast_rain_entity")
-        if forecast_rain_entity:
-            schema_fields[vol.Optional("forecast_rain_entity", default=forecast_rain_entity)] = (
-                selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["sensor", "input_number", "number"])
-                )
-            )
-        else:
-            schema_fields[vol.Optional("forecast_rain_entity")] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor", "input_number", "number"])
-            )
-
-        schema = vol.Schema(schema_fields)
-        return self.async_show_form(step_id="weather_sensors", data_schema=schema)
+        )
 
     async def async_step_location(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Configure location and ET settings."""
+        current_config = ChainMap(self.config_entry.options, self.config_entry.data)
         if user_input is not None:
-            current_options = {**self.config_entry.data, **self.config_entry.options}
-            updated_options = {**current_options, **_filter_none_values(user_input)}
+            updated_options = {**current_config, **_filter_none_values(user_input)}
             return self.async_create_entry(title="", data=updated_options)
 
-        current_config = {**self.config_entry.data, **self.config_entry.options}
-
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    "latitude",
-                    default=current_config.get("latitude", self.hass.config.latitude),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-90, max=90, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Required(
-                    "longitude",
-                    default=current_config.get("longitude", self.hass.config.longitude),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-180, max=180, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Required(
-                    "elevation",
-                    default=current_config.get("elevation", self.hass.config.elevation),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-            }
+        hass_config = self.hass.config
+        defaults = {
+            "latitude": current_config.get("latitude", hass_config.latitude),
+            "longitude": current_config.get("longitude", hass_config.longitude),
+            "elevation": current_config.get("elevation", hass_config.elevation),
+        }
+        return self.async_show_form(
+            step_id="location",
+            data_schema=self.add_suggested_values_to_schema(_location_schema(), defaults),
         )
-        return self.async_show_form(step_id="location", data_schema=schema)
 
     async def async_step_manage_zones(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage irrigation zones."""
-        current_config = {**self.config_entry.data, **self.config_entry.options}
+        current_config = ChainMap(self.config_entry.options, self.config_entry.data)
         current_zones = current_config.get("zones", [])
 
         menu_options = ["add_zone"]
@@ -446,90 +426,21 @@ class AdaptiveIrrigationOptionsFlow(OptionsFlow):
     ) -> ConfigFlowResult:
         """Add a new zone."""
         if user_input is not None:
-            current_config = {**self.config_entry.data, **self.config_entry.options}
-            zones = list(current_config.get("zones", []))
-            zones.append(_filter_none_values(user_input))
-            updated_options = {**current_config, "zones": zones}
+            current_config = ChainMap(self.config_entry.options, self.config_entry.data)
+            existing = current_config.get("zones", ())
+            updated_options = {
+                **current_config,
+                "zones": [*existing, _filter_none_values(user_input)],
+            }
             return self.async_create_entry(title="", data=updated_options)
 
-        schema = vol.Schema(
-            {
-                vol.Required("name"): selector.TextSelector(),
-                vol.Required("sprinkler_entity"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "input_boolean", "valve", "binary_sensor"]
-                    )
-                ),
-                vol.Required(
-                    "precipitation_rate", default=10.0
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm/hour",
-                    )
-                ),
-                vol.Optional("drainage_rate", default=1.0): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        max=50,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm/day",
-                    )
-                ),
-                vol.Optional(
-                    "crop_coefficient", default=DEFAULT_CROP_COEFFICIENT
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0, max=2, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Optional("max_runtime", default=3600): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional("min_runtime", default=60): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional("minimum_interval", default=3600): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional("max_balance", default=5.0): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-200,
-                        max=200,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm",
-                    )
-                ),
-                vol.Optional("min_balance", default=-20.0): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-200,
-                        max=200,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm",
-                    )
-                ),
-            }
-        )
-        return self.async_show_form(step_id="add_zone", data_schema=schema)
+        return self.async_show_form(step_id="add_zone", data_schema=_zone_schema_base())
 
     async def async_step_select_zone_to_edit(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Select which zone to edit."""
-        current_config = {**self.config_entry.data, **self.config_entry.options}
+        current_config = ChainMap(self.config_entry.options, self.config_entry.data)
         zones = current_config.get("zones", [])
 
         if user_input is not None:
@@ -538,18 +449,16 @@ class AdaptiveIrrigationOptionsFlow(OptionsFlow):
             return await self.async_step_edit_zone()
 
         # Create list of zone names for selection
-        zone_options = {
-            str(i): zone.get("name", f"Zone {i + 1}") for i, zone in enumerate(zones)
-        }
+        options = [
+            {"label": zone.get("name", f"Zone {i + 1}"), "value": str(i)}
+            for i, zone in enumerate(zones)
+        ]
 
         schema = vol.Schema(
             {
                 vol.Required("zone_to_edit"): selector.SelectSelector(
                     selector.SelectSelectorConfig(
-                        options=[
-                            {"label": name, "value": idx}
-                            for idx, name in zone_options.items()
-                        ],
+                        options=options,
                         mode=selector.SelectSelectorMode.LIST,
                     )
                 ),
@@ -561,124 +470,30 @@ class AdaptiveIrrigationOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Edit or delete a zone."""
-        current_config = {**self.config_entry.data, **self.config_entry.options}
-        zones = list(current_config.get("zones", []))
-        current_zone = zones[self._edit_zone_index]
+        current_config = ChainMap(self.config_entry.options, self.config_entry.data)
+        current_zone = current_config.get("zones", ())[self._edit_zone_index]
 
         if user_input is not None:
+            zones = list(current_config.get("zones", ()))
             if user_input.get("delete_zone"):
                 # Delete the zone
                 zones.pop(self._edit_zone_index)
                 updated_options = {**current_config, "zones": zones}
                 return self.async_create_entry(title="", data=updated_options)
 
-            # Update the zone
+            # Update the zone, keeping saved values for any cleared fields
             user_input.pop("delete_zone", None)
-            zones[self._edit_zone_index] = _filter_none_values(user_input)
+            zones[self._edit_zone_index] = {
+                **current_zone,
+                **_filter_none_values(user_input),
+            }
             updated_options = {**current_config, "zones": zones}
             return self.async_create_entry(title="", data=updated_options)
 
-        schema = vol.Schema(
-            {
-                vol.Required(
-                    "name", default=current_zone.get("name", "")
-                ): selector.TextSelector(),
-                vol.Required(
-                    "sprinkler_entity",
-                    default=current_zone.get("sprinkler_entity"),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "input_boolean", "valve", "binary_sensor"]
-                    )
-                ),
-                vol.Required(
-                    "precipitation_rate",
-                    default=current_zone.get("precipitation_rate", 10.0),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm/hour",
-                    )
-                ),
-                vol.Optional(
-                    "drainage_rate",
-                    default=current_zone.get("drainage_rate", 1.0),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        max=50,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm/day",
-                    )
-                ),
-                vol.Optional(
-                    "crop_coefficient",
-                    default=current_zone.get(
-                        "crop_coefficient", DEFAULT_CROP_COEFFICIENT
-                    ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0, max=2, mode=selector.NumberSelectorMode.BOX
-                    )
-                ),
-                vol.Optional(
-                    "max_runtime",
-                    default=current_zone.get("max_runtime", 3600),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional(
-                    "min_runtime",
-                    default=current_zone.get("min_runtime", 60),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional(
-                    "minimum_interval",
-                    default=current_zone.get("minimum_interval", 3600),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional(
-                    "max_balance",
-                    default=current_zone.get("max_balance", 5.0),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-200,
-                        max=200,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm",
-                    )
-                ),
-                vol.Optional(
-                    "min_balance",
-                    default=current_zone.get("min_balance", -20.0),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=-200,
-                        max=200,
-                        mode=selector.NumberSelectorMode.BOX,
-                        unit_of_measurement="mm",
-                    )
-                ),
-                vol.Required("delete_zone", default=False): selector.BooleanSelector(),
-            }
-        )
         return self.async_show_form(
             step_id="edit_zone",
-            data_schema=schema,
+            data_schema=self.add_suggested_values_to_schema(
+                _edit_zone_schema(), {**_ZONE_FORM_DEFAULTS, **current_zone}
+            ),
             description_placeholders={"zone_name": current_zone.get("name", "Zone")},
         )
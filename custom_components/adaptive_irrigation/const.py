@@ -1,26 +1,45 @@
 """Constants for the Adaptive Irrigation integration."""
 
+from functools import lru_cache
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceInfo
 
 DOMAIN = "adaptive_irrigation"
 
+# Seconds between re-checks of time-based zone constraints (minimum interval)
+REFRESH_INTERVAL = 60
+
+# Entity states that carry no usable value
+INVALID_STATES = frozenset(("unknown", "unavailable"))
+
 # ET calculation methods
 ET_METHOD_PENMAN_MONTEITH = "penman_monteith"
 ET_METHOD_HARGREAVES = "hargreaves"
 ET_METHOD_PRIESTLEY_TAYLOR = "priestley_taylor"
 
-ET_METHODS = [
-    ET_METHOD_PENMAN_MONTEITH,
-    ET_METHOD_HARGREAVES,
-    ET_METHOD_PRIESTLEY_TAYLOR,
-]
+ET_METHODS: frozenset[str] = frozenset(
+    {
+        ET_METHOD_PENMAN_MONTEITH,
+        ET_METHOD_HARGREAVES,
+        ET_METHOD_PRIESTLEY_TAYLOR,
+    }
+)
 
 
 def get_device_info(entry: ConfigEntry) -> DeviceInfo:
     """Get device info for the Adaptive Irrigation controller."""
+    return _device_info_for(entry.entry_id)
+
+
+@lru_cache(maxsize=32)
+def _device_info_for(entry_id: str) -> DeviceInfo:
+    """Build the device info for an entry once and share it between platforms.
+
+    Callers must treat the result as read-only.
+    """
     return DeviceInfo(
-        identifiers={(DOMAIN, entry.entry_id)},
+        identifiers={(DOMAIN, entry_id)},
         name="Adaptive Irrigation Controller",
         manufacturer="Adaptive Irrigation",
         model="Irrigation Controller",
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
+import sys
+from typing import TYPE_CHECKING
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_call_later
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.restore_state import (
+    RestoreEntity,
+    RestoreStateData,
+    async_get as async_get_restore_data,
+)
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, get_device_info
+from . import update_runtime_sensors
+from .const import DOMAIN, INVALID_STATES, get_device_info
+
+if TYPE_CHECKING:
+    from .state import ZoneState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,25 +38,47 @@ async def async_setup_entry(
 
     device_info = get_device_info(entry)
     
-    # Get zones from config
-    config_data = {**entry.data, **entry.options}
-    zones = config_data.get("zones", [])
+    # Get zones from config (options override the original data)
+    if "zones" in entry.options:
+        zones = entry.options["zones"]
+    else:
+        zones = entry.data.get("zones", [])
     
     numbers = []
     
+    # Restored states are loaded once for all zones rather than per entity
+    restore_data = async_get_restore_data(hass)
+    
+    # Balances snapshotted at the last shutdown or unload, if any
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    snapshot = entry_data.get("stored_balances") or {}
+    snapshot_balances = snapshot.get("balances", {})
+    saved_at = None
+    if "saved_at" in snapshot:
+        saved_at = dt_util.parse_datetime(snapshot["saved_at"])
+    
     # Create soil moisture balance number for each zone
     for idx, zone in enumerate(zones):
-        zone_id = f"zone_{idx}"
-        number = SoilMoistureBalanceNumber(entry, device_info, zone_id, zone.get("name", f"Zone {idx + 1}"))
+        zone_id = sys.intern(f"zone_{idx}")
+        zone_snapshot = None
+        if saved_at is not None and zone_id in snapshot_balances:
+            zone_snapshot = (snapshot_balances[zone_id], saved_at)
+        number = SoilMoistureBalanceNumber(
+            entry,
+            device_info,
+            zone_id,
+            zone.get("name", f"Zone {idx + 1}"),
+            restore_data,
+            zone_snapshot,
+        )
         numbers.append(number)
     
-    # Store entity references in the entry-specific data
-    if "entities" not in hass.data[DOMAIN][entry.entry_id]:
-        hass.data[DOMAIN][entry.entry_id]["entities"] = {}
-    
+    # Store entity references directly on the zone state
+    state = entry_data["state"]
     for number in numbers:
-        zone_id = number._zone_id
-        hass.data[DOMAIN][entry.entry_id]["entities"][f"soil_moisture_balance_{zone_id}"] = number
+        zone_state = state.zones.get(number._zone_id)
+        if zone_state is not None:
+            zone_state.number_entity = number
     
     async_add_entities(numbers)
 
@@ -66,23 +100,46 @@ class SoilMoistureBalanceNumber(RestoreEntity, NumberEntity):
     _attr_native_step = 0.1
     _attr_should_poll = False
 
-    def __init__(self, entry: ConfigEntry, device_info, zone_id: str, zone_name: str) -> None:
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        device_info,
+        zone_id: str,
+        zone_name: str,
+        restore_data: RestoreStateData,
+        snapshot: tuple[float, datetime] | None = None,
+    ) -> None:
         """Initialize the number entity."""
         self._zone_id = zone_id
+        self._restore_data = restore_data
+        self._snapshot = snapshot  # (balance, saved_at) from the balance store
         self._entry_id = entry.entry_id
         self._attr_name = f"{zone_name} Soil Moisture Balance"
         self._attr_unique_id = f"{entry.entry_id}_{zone_id}_soil_moisture_balance"
         self._attr_native_value = 0.0  # Default to optimal (0mm balance)
         self._attr_device_info = device_info
+        self._zone_state: ZoneState | None = None  # Resolved when added to hass
     
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass - restore state if available."""
         await super().async_added_to_hass()
         
-        # Try to restore previous state
-        last_state = await self.async_get_last_state()
+        # The entry's state outlives this entity, so resolve the zone once
+        state = self.hass.data[DOMAIN][self._entry_id]["state"]
+        self._zone_state = state.zones.get(self._zone_id)
+        
+        # Try to restore previous state from the shared restore data
+        stored = self._restore_data.last_states.get(self.entity_id)
+        last_state = stored.state if stored is not None else None
         
-        if last_state is not None and last_state.state not in ("unknown", "unavailable"):
+        # Prefer the balance snapshot unless the restored state is newer,
+        # as it is after a crash that skipped the shutdown snapshot
+        if self._snapshot is not None and (
+            last_state is None or last_state.last_updated <= self._snapshot[1]
+        ):
+            self._attr_native_value = self._snapshot[0]
+            _LOGGER.info("Restored soil moisture balance for zone %s from snapshot: %.2f mm", self._zone_id, self._attr_native_value)
+        elif last_state is not None and last_state.state not in INVALID_STATES:
             try:
                 self._attr_native_value = float(last_state.state)
                 _LOGGER.info("Restored soil moisture balance for zone %s: %.2f mm", self._zone_id, self._attr_native_value)
@@ -94,11 +151,9 @@ class SoilMoistureBalanceNumber(RestoreEntity, NumberEntity):
             self._attr_native_value = 0.0
         
         # Update the integration's state to match restored value
-        if DOMAIN in self.hass.data and self._entry_id in self.hass.data[DOMAIN]:
-            state = self.hass.data[DOMAIN][self._entry_id].get("state")
-            if state and self._zone_id in state.zones:
-                state.zones[self._zone_id].soil_moisture_balance = self._attr_native_value
-                _LOGGER.debug("Synced integration state with restored balance: %.2f mm", self._attr_native_value)
+        if self._zone_state is not None:
+            self._zone_state.soil_moisture_balance = self._attr_native_value
+            _LOGGER.debug("Synced integration state with restored balance: %.2f mm", self._attr_native_value)
         
         # Schedule update of sensors after a short delay to ensure all entities are loaded
         @callback
@@ -110,12 +165,17 @@ class SoilMoistureBalanceNumber(RestoreEntity, NumberEntity):
 
     @callback
     def update_value(self, balance: float) -> None:
-        """Update the balance value and notify HA."""
-        self._attr_native_value = round(balance, 2)
-        self.async_write_ha_state()
-        
-        # Also update the runtime sensor
-        self._update_runtime_sensor(balance)
+        """Update the balance value and notify HA.
+
+        The caller recalculates the zone's runtime sensors, so several zones
+        can be updated together.
+        """
+        value = round(balance, 2)
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        if self.hass is not None:
+            self.async_write_ha_state()
     
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value (user override)."""
@@ -123,20 +183,17 @@ class SoilMoistureBalanceNumber(RestoreEntity, NumberEntity):
         self.async_write_ha_state()
         
         # Update the state in our integration's state management
-        if DOMAIN in self.hass.data and self._entry_id in self.hass.data[DOMAIN]:
-            state = self.hass.data[DOMAIN][self._entry_id].get("state")
-            if state and self._zone_id in state.zones:
-                state.zones[self._zone_id].soil_moisture_balance = value
-                _LOGGER.info(
-                    "User manually set soil moisture balance for zone %s to %.2f mm",
-                    self._zone_id,
-                    value
-                )
+        if self._zone_state is not None:
+            self._zone_state.soil_moisture_balance = value
+            _LOGGER.info(
+                "User manually set soil moisture balance for zone %s to %.2f mm",
+                self._zone_id,
+                value
+            )
         
         # Also update the runtime sensor
         self._update_runtime_sensor(value)
     
     def _update_runtime_sensor(self, balance: float) -> None:
         """Trigger recalculation and update of runtime sensors via coordinator."""
-        from . import update_runtime_sensors
         update_runtime_sensors(self.hass, self._entry_id, self._zone_id)
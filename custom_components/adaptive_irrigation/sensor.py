@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import logging
+import sys
+from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.restore_state import (
+    RestoreEntity,
+    RestoreStateData,
+    async_get as async_get_restore_data,
+)
 
-from .const import DOMAIN, get_device_info
+from .const import DOMAIN, INVALID_STATES, get_device_info
+
+if TYPE_CHECKING:
+    from .state import ZoneState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,28 +35,33 @@ async def async_setup_entry(
 
     device_info = get_device_info(entry)
     
-    # Get zones from config
-    config_data = {**entry.data, **entry.options}
-    zones = config_data.get("zones", [])
+    # Get zones from config (options override the original data)
+    if "zones" in entry.options:
+        zones = entry.options["zones"]
+    else:
+        zones = entry.data.get("zones", [])
     
-    sensors = []
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    state = entry_data["state"]
     
     # Create reference ET sensor (single, integration-level)
-    et0_sensor = ReferenceETSensor(entry, device_info)
-    sensors.append(et0_sensor)
+    et0_sensor = ReferenceETSensor(entry, device_info, async_get_restore_data(hass))
+    sensors = [et0_sensor]
+    state.et0_sensor = et0_sensor
     
-    # Create runtime sensors for each zone
+    # Create runtime sensors for each zone, wiring direct references on the
+    # zone state as they are created so updates don't look them up by key
     for idx, zone in enumerate(zones):
-        zone_id = f"zone_{idx}"
-        precipitation_rate = zone.get("precipitation_rate", 10.0)
+        zone_id = sys.intern(f"zone_{idx}")
+        zone_name = zone.get("name", f"Zone {idx + 1}")
+        zone_state = state.zones.get(zone_id)
         
         # Required runtime sensor (basic calculation)
         required_sensor = RequiredRuntimeSensor(
-            entry, 
-            device_info, 
-            zone_id, 
-            zone.get("name", f"Zone {idx + 1}"),
-            precipitation_rate
+            entry,
+            device_info,
+            zone_id,
+            zone_name
         )
         sensors.append(required_sensor)
         
@@ -56,30 +70,45 @@ async def async_setup_entry(
             entry,
             device_info,
             zone_id,
-            zone.get("name", f"Zone {idx + 1}")
+            zone_name
         )
         sensors.append(next_sensor)
-    
-    # Store entity references in the entry-specific data
-    if "entities" not in hass.data[DOMAIN][entry.entry_id]:
-        hass.data[DOMAIN][entry.entry_id]["entities"] = {}
-    
-    # Store ET0 sensor reference
-    hass.data[DOMAIN][entry.entry_id]["entities"]["et0_sensor"] = et0_sensor
-    
-    for sensor in sensors:
-        if isinstance(sensor, ReferenceETSensor):
-            continue  # Already stored above
-        zone_id = sensor._zone_id
-        if isinstance(sensor, RequiredRuntimeSensor):
-            hass.data[DOMAIN][entry.entry_id]["entities"][f"runtime_{zone_id}"] = sensor
-        elif isinstance(sensor, NextRuntimeSensor):
-            hass.data[DOMAIN][entry.entry_id]["entities"][f"next_runtime_{zone_id}"] = sensor
+        
+        if zone_state is not None:
+            zone_state.runtime_sensor = required_sensor
+            zone_state.next_runtime_sensor = next_sensor
     
     async_add_entities(sensors)
 
 
-class ReferenceETSensor(RestoreEntity, SensorEntity):
+class _RoundedValueMixin:
+    """Sensor mixin that stores values rounded to the display precision.
+
+    Rounding before comparing keeps float jitter that would display the same
+    from writing state and recorder rows.
+    """
+
+    _attr_native_value: float | None
+    _attr_suggested_display_precision: int
+
+    @callback
+    def _set_native_value(self, value: float | None) -> None:
+        """Set the rounded value, only writing state when it changed.
+
+        Before the entity is added the value is just stored, so it is written
+        when the entity is added.
+        """
+        if value is not None:
+            precision = self._attr_suggested_display_precision
+            value = round(value, precision) if precision else round(value)
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+
+class ReferenceETSensor(_RoundedValueMixin, RestoreEntity, SensorEntity):
     """Sensor showing reference evapotranspiration (ET0) from yesterday.
     
     This is the ET value before crop coefficient adjustment.
@@ -90,9 +119,12 @@ class ReferenceETSensor(RestoreEntity, SensorEntity):
     _attr_should_poll = False
     _attr_suggested_display_precision = 2
 
-    def __init__(self, entry: ConfigEntry, device_info) -> None:
+    def __init__(
+        self, entry: ConfigEntry, device_info, restore_data: RestoreStateData
+    ) -> None:
         """Initialize the sensor."""
         self._entry_id = entry.entry_id
+        self._restore_data = restore_data
         self._attr_name = "Yesterday Reference Evapotranspiration"
         self._attr_unique_id = f"{entry.entry_id}_yesterday_reference_et"
         self._attr_native_value = None
@@ -102,10 +134,11 @@ class ReferenceETSensor(RestoreEntity, SensorEntity):
         """Run when entity is added to hass - restore state if available."""
         await super().async_added_to_hass()
         
-        # Try to restore previous state
-        last_state = await self.async_get_last_state()
+        # Try to restore previous state from the shared restore data
+        stored = self._restore_data.last_states.get(self.entity_id)
+        last_state = stored.state if stored is not None else None
         
-        if last_state is not None and last_state.state not in ("unknown", "unavailable"):
+        if last_state is not None and last_state.state not in INVALID_STATES:
             try:
                 self._attr_native_value = float(last_state.state)
                 _LOGGER.info("Restored reference ET: %.2f mm", self._attr_native_value)
@@ -119,11 +152,10 @@ class ReferenceETSensor(RestoreEntity, SensorEntity):
     @callback
     def update_et0(self, et0_value: float) -> None:
         """Update the ET0 value and notify HA."""
-        self._attr_native_value = round(et0_value, 2)
-        self.async_write_ha_state()
+        self._set_native_value(et0_value)
 
 
-class RequiredRuntimeSensor(SensorEntity):
+class RequiredRuntimeSensor(_RoundedValueMixin, SensorEntity):
     """Sensor showing required sprinkler runtime to reach optimal moisture (0mm balance).
     
     This entity simply reads pre-calculated values from state.
@@ -134,14 +166,14 @@ class RequiredRuntimeSensor(SensorEntity):
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
     _attr_should_poll = False
+    _attr_suggested_display_precision = 0
 
     def __init__(
         self, 
         entry: ConfigEntry, 
         device_info, 
         zone_id: str, 
-        zone_name: str,
-        precipitation_rate: float
+        zone_name: str
     ) -> None:
         """Initialize the sensor."""
         self._zone_id = zone_id
@@ -150,31 +182,25 @@ class RequiredRuntimeSensor(SensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_{zone_id}_required_runtime"
         self._attr_native_value = 0
         self._attr_device_info = device_info
+        self._zone_state: ZoneState | None = None  # Resolved when added to hass
+
+    async def async_added_to_hass(self) -> None:
+        """Resolve the zone state once, as it outlives this entity."""
+        await super().async_added_to_hass()
+        state = self.hass.data[DOMAIN][self._entry_id]["state"]
+        self._zone_state = state.zones.get(self._zone_id)
 
     @callback
     def refresh_from_state(self) -> None:
         """Refresh entity value from pre-calculated state."""
-        if DOMAIN not in self.hass.data or self._entry_id not in self.hass.data[DOMAIN]:
-            self._attr_native_value = 0
-            self.async_write_ha_state()
-            return
-        
-        entry_data = self.hass.data[DOMAIN][self._entry_id]
-        state = entry_data.get("state")
-        
-        if not state or self._zone_id not in state.zones:
-            self._attr_native_value = 0
-            self.async_write_ha_state()
-            return
-        
-        zone_state = state.zones[self._zone_id]
+        if self._zone_state is None:
+            return  # Not added yet, refreshed again once it is
         
         # Read pre-calculated value from state
-        self._attr_native_value = round(zone_state.calculated.required_runtime_seconds)
-        self.async_write_ha_state()
+        self._set_native_value(self._zone_state.calculated.required_runtime_seconds)
 
 
-class NextRuntimeSensor(SensorEntity):
+class NextRuntimeSensor(_RoundedValueMixin, SensorEntity):
     """Sensor showing next runtime accounting for scheduling constraints.
     
     This entity simply reads pre-calculated values from state.
@@ -185,6 +211,7 @@ class NextRuntimeSensor(SensorEntity):
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
     _attr_should_poll = False
+    _attr_suggested_display_precision = 0
 
     def __init__(
         self, 
@@ -200,29 +227,22 @@ class NextRuntimeSensor(SensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_{zone_id}_next_runtime"
         self._attr_native_value = 0
         self._attr_device_info = device_info
+        self._zone_state: ZoneState | None = None  # Resolved when added to hass
+
+    async def async_added_to_hass(self) -> None:
+        """Resolve the zone state once, as it outlives this entity."""
+        await super().async_added_to_hass()
+        state = self.hass.data[DOMAIN][self._entry_id]["state"]
+        self._zone_state = state.zones.get(self._zone_id)
 
     @callback
     def refresh_from_state(self) -> None:
         """Refresh entity value from pre-calculated state."""
-        if DOMAIN not in self.hass.data or self._entry_id not in self.hass.data[DOMAIN]:
-            self._attr_native_value = 0
-            self.async_write_ha_state()
-            return
-        
-        entry_data = self.hass.data[DOMAIN][self._entry_id]
-        state = entry_data.get("state")
-        
-        if not state or self._zone_id not in state.zones:
-            self._attr_native_value = 0
-            self.async_write_ha_state()
-            return
-        
-        zone_state = state.zones[self._zone_id]
+        if self._zone_state is None:
+            return  # Not added yet, refreshed again once it is
         
         # Read pre-calculated values from state
-        if zone_state.calculated.can_run:
-            self._attr_native_value = round(zone_state.calculated.clamped_runtime_seconds)
-        else:
-            self._attr_native_value = 0
-        
-        self.async_write_ha_state()
+        calculated = self._zone_state.calculated
+        self._set_native_value(
+            calculated.clamped_runtime_seconds if calculated.can_run else 0
+        )
@@ -1,8 +1,18 @@
 """State management for Adaptive Irrigation integration."""
 
+from __future__ import annotations
+
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .binary_sensor import ZoneCanRunBinarySensor
+    from .number import SoilMoistureBalanceNumber
+    from .sensor import NextRuntimeSensor, ReferenceETSensor, RequiredRuntimeSensor
 
 
+@dataclass(slots=True)
 class ZoneCalculatedValues:
     """Pre-calculated runtime values for a zone.
     
@@ -15,9 +25,19 @@ class ZoneCalculatedValues:
     clamped_runtime_seconds: float = 0.0  # Runtime clamped to min/max limits
     forecast_rain_mm: float = 0.0  # Amount of forecasted rain accounted for
     can_run: bool = False  # Whether the zone should run
-    reason: str = ""  # Human-readable reason for can_run status
+    reason_template: str = ""  # %-style template for the can_run reason
+    reason_args: tuple = ()  # Values for reason_template
+    last_inputs: tuple[float, float] | None = None  # (balance, forecast rain) the values were calculated from
+
+    @property
+    def reason(self) -> str:
+        """Human-readable reason for can_run status, formatted on demand."""
+        if self.reason_args:
+            return self.reason_template % self.reason_args
+        return self.reason_template
 
 
+@dataclass(slots=True)
 class ZoneState:
     """State for an irrigation zone."""
 
@@ -26,18 +46,85 @@ class ZoneState:
     last_et: float = 0.0  # mm
     last_et_calculation: datetime | None = None
     last_midnight_update: datetime | None = None
-    sprinkler_on_time: datetime | None = None
-    sprinkler_off_time: datetime | None = None  # Track when valve was last turned off
+    sprinkler_on_time: float | None = None  # time.monotonic() when the valve opened
+    sprinkler_off_time: float | None = None  # time.monotonic() when the valve last closed
     total_sprinkler_runtime_today: float = 0.0  # seconds
+    number_entity: SoilMoistureBalanceNumber | None = None  # Set when the number platform loads
+    runtime_sensor: RequiredRuntimeSensor | None = None  # Set when the sensor platform loads
+    next_runtime_sensor: NextRuntimeSensor | None = None  # Set when the sensor platform loads
+    can_run_sensor: ZoneCanRunBinarySensor | None = None  # Set when the binary sensor platform loads
     
     # Pre-calculated values (updated by coordinator)
-    calculated: ZoneCalculatedValues
+    calculated: ZoneCalculatedValues = field(default_factory=ZoneCalculatedValues)
+
+
+@dataclass(slots=True)
+class ReadingStats:
+    """Running time-weighted aggregate of sensor readings.
     
-    def __init__(self):
-        """Initialize zone state."""
-        self.calculated = ZoneCalculatedValues()
+    Each reading counts for as long as it stayed the sensor's state, the
+    same way the recorder weights its hourly statistics, so the mean is
+    comparable whether it was built from state changes, raw history or
+    statistics. Keeps only a few numbers so memory stays constant no matter
+    how many readings are added.
+    """
+
+    count: int = 0
+    weighted_total: float = 0.0  # sum of value * hours
+    hours: float = 0.0  # total weight
+    minimum: float | None = None
+    maximum: float | None = None
+    last_value: float | None = None  # latest reading
+    last_time: datetime | None = None  # when the reading still in effect was taken
+
+    def add(self, value: float, when: datetime) -> None:
+        """Add a reading taken at when, ending the previous one."""
+        if self.last_time is not None and when < self.last_time:
+            when = self.last_time
+        self.close(when)
+        self.count += 1
+        self.last_value = value
+        self.last_time = when
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def add_period(
+        self, mean: float, minimum: float, maximum: float, hours: float = 1.0
+    ) -> None:
+        """Add a pre-aggregated period (e.g. one hour of statistics), weighted by its length."""
+        self.count += 1
+        self.weighted_total += mean * hours
+        self.hours += hours
+        if self.minimum is None or minimum < self.minimum:
+            self.minimum = minimum
+        if self.maximum is None or maximum > self.maximum:
+            self.maximum = maximum
 
+    def close(self, end: datetime) -> None:
+        """End the reading still in effect at end (period end or unavailable)."""
+        if self.last_time is None:
+            return
+        if end > self.last_time:
+            elapsed = (end - self.last_time).total_seconds() / 3600
+            self.weighted_total += self.last_value * elapsed
+            self.hours += elapsed
+        self.last_time = None
 
+    @property
+    def mean(self) -> float | None:
+        """Time-weighted average, or None if there are no readings.
+
+        Readings that were never in effect for any time (e.g. a single one
+        at the period end) fall back to the latest value.
+        """
+        if self.hours > 0:
+            return self.weighted_total / self.hours
+        return self.last_value
+
+
+@dataclass(slots=True)
 class WeatherState:
     """State for weather sensor data."""
 
@@ -49,15 +136,47 @@ class WeatherState:
     pressure: float | None = None
     precipitation: float = 0.0
 
+    # Readings accumulated from state changes since daily_stats_start,
+    # keyed by the attribute name above
+    daily_stats: dict[str, ReadingStats] = field(default_factory=dict)
+    daily_stats_start: datetime | None = None
+
+    def reset_daily_stats(self, start: datetime) -> dict[str, ReadingStats]:
+        """Start accumulating a new day of readings and return the previous ones.
+
+        The previous aggregates are closed at start. Each new aggregate is
+        seeded with the latest known value, matching the start-of-period
+        state the recorder would include.
+        """
+        previous = self.daily_stats
+        for stats in previous.values():
+            stats.close(start)
+        self.daily_stats = {}
+        self.daily_stats_start = start
+        for attr in DAILY_STATS_ATTRS:
+            value = getattr(self, attr)
+            if value is not None:
+                stats = ReadingStats()
+                stats.add(value, start)
+                self.daily_stats[attr] = stats
+        return previous
 
+
+# Weather attributes averaged over the day for the ET calculation
+DAILY_STATS_ATTRS = (
+    "temperature",
+    "humidity",
+    "wind_speed",
+    "solar_radiation",
+    "pressure",
+)
+
+
+@dataclass(slots=True)
 class State:
     """Global state for Adaptive Irrigation integration."""
 
-    zones: dict[str, ZoneState] = {}
-    weather: WeatherState
+    zones: dict[str, ZoneState] = field(default_factory=dict)
+    weather: WeatherState = field(default_factory=WeatherState)
     last_update: datetime | None = None
-
-    def __init__(self):
-        """Initialize state."""
-        self.weather = WeatherState()
-        self.zones = {}
+    et0_sensor: ReferenceETSensor | None = None  # Set when the sensor platform loads
@@ -0,0 +1 @@
+"""Tests for the Adaptive Irrigation integration."""
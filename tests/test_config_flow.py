@@ -0,0 +1,114 @@
+"""Tests for the Adaptive Irrigation config flow."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.adaptive_irrigation.const import DOMAIN
+
+
+async def test_edit_zone_fills_missing_keys_from_form_defaults(
+    hass: HomeAssistant,
+) -> None:
+    """A zone saved without some keys is edited with the add form defaults."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Adaptive Irrigation",
+        data={
+            "name": "Adaptive Irrigation",
+            "temperature_entity": "sensor.temperature",
+            "humidity_entity": "sensor.humidity",
+            "precipitation_entity": "sensor.rain",
+            "zones": [
+                {
+                    "name": "Lawn",
+                    "sprinkler_entity": "switch.lawn",
+                    "precipitation_rate": 12.0,
+                }
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "manage_zones"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "select_zone_to_edit"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"zone_to_edit": "0"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "edit_zone"
+
+    suggested = {
+        key.schema: key.description["suggested_value"]
+        for key in result["data_schema"].schema
+        if key.description and "suggested_value" in key.description
+    }
+    # Saved values win, missing keys fall back to the add form defaults
+    assert suggested["precipitation_rate"] == 12.0
+    assert suggested["max_balance"] == 5.0
+    assert suggested["min_balance"] == -20.0
+    assert suggested["max_runtime"] == 3600
+
+    # The frontend submits the suggested values it prefilled
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {**suggested, "crop_coefficient": 0.8}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+
+    zone = entry.options["zones"][0]
+    assert zone["precipitation_rate"] == 12.0
+    assert zone["crop_coefficient"] == 0.8
+    assert zone["max_balance"] == 5.0
+    assert zone["min_balance"] == -20.0
+    assert "delete_zone" not in zone
+
+
+async def test_edit_zone_keeps_saved_value_when_field_cleared(
+    hass: HomeAssistant,
+) -> None:
+    """Clearing an optional field keeps the saved value, not the form default."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Adaptive Irrigation",
+        data={
+            "name": "Adaptive Irrigation",
+            "temperature_entity": "sensor.temperature",
+            "humidity_entity": "sensor.humidity",
+            "precipitation_entity": "sensor.rain",
+            "zones": [
+                {
+                    "name": "Lawn",
+                    "sprinkler_entity": "switch.lawn",
+                    "precipitation_rate": 12.0,
+                    "max_runtime": 900,
+                }
+            ],
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "manage_zones"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "select_zone_to_edit"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"zone_to_edit": "0"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            "name": "Lawn",
+            "sprinkler_entity": "switch.lawn",
+            "precipitation_rate": 12.0,
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options["zones"][0]["max_runtime"] == 900
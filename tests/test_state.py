@@ -0,0 +1,59 @@
+"""Tests for the Adaptive Irrigation state helpers."""
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.adaptive_irrigation.state import ReadingStats, WeatherState
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_readings_are_weighted_by_how_long_they_were_in_effect() -> None:
+    """State change readings give a time-weighted mean like the recorder."""
+    stats = ReadingStats()
+    stats.add(10.0, START)
+    stats.add(20.0, START + timedelta(hours=3))
+    stats.close(START + timedelta(hours=4))
+
+    assert stats.mean == 12.5
+    assert stats.minimum == 10.0
+    assert stats.maximum == 20.0
+    assert stats.hours == 4.0
+
+
+def test_closed_reading_does_not_cover_unavailable_time() -> None:
+    """Time after a reading is closed (e.g. unavailable) carries no weight."""
+    stats = ReadingStats()
+    stats.add(10.0, START)
+    stats.close(START + timedelta(hours=1))
+    stats.add(30.0, START + timedelta(hours=5))
+    stats.close(START + timedelta(hours=6))
+
+    assert stats.mean == 20.0
+    assert stats.hours == 2.0
+
+
+def test_periods_are_weighted_by_their_length() -> None:
+    """Hourly statistics and longer backfilled spans mix by duration."""
+    stats = ReadingStats()
+    stats.add_period(10.0, 5.0, 15.0)
+    stats.add_period(20.0, 18.0, 22.0, hours=3.0)
+
+    assert stats.mean == 17.5
+    assert stats.minimum == 5.0
+    assert stats.maximum == 22.0
+
+
+def test_reset_daily_stats_closes_previous_day() -> None:
+    """The previous day's readings are weighted up to the reset time."""
+    weather = WeatherState()
+    weather.reset_daily_stats(START)
+    weather.temperature = 10.0
+    weather.daily_stats["temperature"] = stats = ReadingStats()
+    stats.add(10.0, START)
+    weather.temperature = 16.0
+    stats.add(16.0, START + timedelta(hours=18))
+
+    previous = weather.reset_daily_stats(START + timedelta(days=1))
+
+    assert previous["temperature"].mean == 11.5
+    assert weather.daily_stats["temperature"].mean == 16.0